@@ -12,6 +12,7 @@ from infrastructure.repositories.jewelry_repository import JewelryItemRepository
 from infrastructure.repositories.bid_repository import BidRepository
 from infrastructure.repositories.payment_repository import PaymentRepository, PayoutRepository, TransactionFeeRepository
 from infrastructure.databases.mssql import get_db_session
+from infrastructure.services.cache_service import CacheService
 from domain.exceptions import (
     ValidationError,
     NotFoundError,
@@ -31,7 +32,7 @@ def get_auction_service():
     session_item_repo = SessionItemRepository(session)
     enrollment_repo = EnrollmentRepository(session)
     jewelry_repo = JewelryItemRepository(session)
-    return AuctionService(session_repo, session_item_repo, enrollment_repo, jewelry_repo)
+    return AuctionService(session_repo, session_item_repo, enrollment_repo, jewelry_repo, CacheService())
 
 def get_bidding_service():
     """Get bidding service instance"""
@@ -40,7 +41,7 @@ def get_bidding_service():
     session_repo = AuctionSessionRepository(session)
     session_item_repo = SessionItemRepository(session)
     enrollment_repo = EnrollmentRepository(session)
-    return BiddingService(bid_repo, session_repo, session_item_repo, enrollment_repo)
+    return BiddingService(bid_repo, session_repo, session_item_repo, enrollment_repo, CacheService())
 
 def get_settlement_service():
     """Get settlement service instance"""
@@ -125,9 +126,6 @@ def create_auction_session():
         return jsonify({'error': str(e)}), 400
     except AuthorizationError as e:
         return jsonify({'error': str(e)}), 403
-    except Exception as e:
-        current_app.logger.error(f"Error creating auction session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @auction_bp.route('', methods=['GET'])
@@ -154,28 +152,23 @@ def list_auction_sessions():
       200:
         description: List of auction sessions
     """
-    try:
-        # Get query parameters
-        status = request.args.get('status')
-        page = int(request.args.get('page', 1))
-        page_size = int(request.args.get('page_size', 20))
-        
-        # Build filters
-        filters = {}
-        if status:
-            filters['status'] = status
-        
-        auction_service = get_auction_service()
-        result = auction_service.list_auction_sessions(filters, page, page_size)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error listing auction sessions: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    # Get query parameters
+    status = request.args.get('status')
+    page = int(request.args.get('page', 1))
+    page_size = int(request.args.get('page_size', 20))
+    
+    # Build filters
+    filters = {}
+    if status:
+        filters['status'] = status
+    
+    auction_service = get_auction_service()
+    result = auction_service.list_auction_sessions(filters, page, page_size)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @auction_bp.route('/<session_id>', methods=['GET'])
@@ -196,21 +189,16 @@ def get_auction_session(session_id):
       404:
         description: Session not found
     """
-    try:
-        auction_service = get_auction_service()
-        result = auction_service.get_auction_session(session_id)
-        
-        if not result:
-            return jsonify({'error': 'Auction session not found'}), 404
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting auction session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    auction_service = get_auction_service()
+    result = auction_service.get_auction_session(session_id)
+    
+    if not result:
+        return jsonify({'error': 'Auction session not found'}), 404
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @auction_bp.route('/<session_id>/schedule', methods=['POST'])
@@ -255,9 +243,6 @@ def schedule_session(session_id):
         return jsonify({'error': str(e)}), 400
     except AuthorizationError as e:
         return jsonify({'error': str(e)}), 403
-    except Exception as e:
-        current_app.logger.error(f"Error scheduling session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @auction_bp.route('/<session_id>/open', methods=['POST'])
@@ -302,9 +287,6 @@ def open_session(session_id):
         return jsonify({'error': str(e)}), 400
     except AuthorizationError as e:
         return jsonify({'error': str(e)}), 403
-    except Exception as e:
-        current_app.logger.error(f"Error opening session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @auction_bp.route('/<session_id>/close', methods=['POST'])
@@ -349,9 +331,6 @@ def close_session(session_id):
         return jsonify({'error': str(e)}), 400
     except AuthorizationError as e:
         return jsonify({'error': str(e)}), 403
-    except Exception as e:
-        current_app.logger.error(f"Error closing session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @auction_bp.route('/<session_id>/items', methods=['GET'])
@@ -372,18 +351,13 @@ def get_session_items(session_id):
       404:
         description: Session not found
     """
-    try:
-        auction_service = get_auction_service()
-        result = auction_service.get_session_items(session_id)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting session items: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    auction_service = get_auction_service()
+    result = auction_service.get_session_items(session_id)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @auction_bp.route('/<session_id>/enroll', methods=['POST'])
@@ -426,9 +400,6 @@ def enroll_in_session(session_id):
         return jsonify({'error': str(e)}), 404
     except BusinessRuleViolationError as e:
         return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error enrolling in session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @auction_bp.route('/sessions', methods=['POST'])
@@ -502,7 +473,7 @@ def create_session():
             'code': 'VALIDATION_ERROR'
         }), 400
     except Exception as e:
-        current_app.logger.error(f"Create session error: {str(e)}")
+        current_app.logger.error("Create session error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to create session',
@@ -588,7 +559,7 @@ def assign_items_to_session(session_id):
             'code': 'VALIDATION_ERROR'
         }), 400
     except Exception as e:
-        current_app.logger.error(f"Assign items to session error: {str(e)}")
+        current_app.logger.error("Assign items to session error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to assign items to session',
@@ -646,7 +617,7 @@ def open_session_manager(session_id):
             'code': 'BUSINESS_RULE_VIOLATION'
         }), 400
     except Exception as e:
-        current_app.logger.error(f"Open session error: {str(e)}")
+        current_app.logger.error("Open session error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to open session',
@@ -704,9 +675,61 @@ def close_session_manager(session_id):
             'code': 'BUSINESS_RULE_VIOLATION'
         }), 400
     except Exception as e:
-        current_app.logger.error(f"Close session error: {str(e)}")
+        current_app.logger.error("Close session error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to close session',
             'code': 'CLOSE_ERROR'
         }), 500
+
+
+@auction_bp.route('/sessions/open-due', methods=['POST'])
+@manager_required
+def open_due_sessions():
+    """
+    Open all scheduled sessions whose start time has arrived (MANAGER only)
+    ---
+    tags:
+      - Auctions
+    security:
+      - Bearer: []
+    responses:
+      200:
+        description: Due sessions opened
+      403:
+        description: Insufficient permissions
+    """
+    auction_service = get_auction_service()
+    result = auction_service.open_due_sessions()
+
+    return jsonify({
+        'success': True,
+        'message': 'Due sessions opened successfully',
+        'data': result
+    }), 200
+
+
+@auction_bp.route('/sessions/close-expired', methods=['POST'])
+@manager_required
+def close_expired_sessions():
+    """
+    Close all open sessions whose end time has passed (MANAGER only)
+    ---
+    tags:
+      - Auctions
+    security:
+      - Bearer: []
+    responses:
+      200:
+        description: Expired sessions closed
+      403:
+        description: Insufficient permissions
+    """
+    auction_service = get_auction_service()
+    result = auction_service.close_expired_sessions()
+
+    return jsonify({
+        'success': True,
+        'message': 'Expired sessions closed successfully',
+        'data': result
+    }), 200
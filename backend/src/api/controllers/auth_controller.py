@@ -386,7 +386,7 @@ def register():
             'code': 'DUPLICATE_EMAIL'
         }), 409
     except Exception as e:
-        current_app.logger.error(f"Registration error: {str(e)}")
+        current_app.logger.error("Registration error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Registration failed',
@@ -8,18 +8,39 @@ from services.bidding_service import BiddingService
 from infrastructure.repositories.bid_repository import BidRepository
 from infrastructure.repositories.auction_repository import AuctionSessionRepository, SessionItemRepository, EnrollmentRepository
 from infrastructure.databases.mssql import get_db_session
+from infrastructure.services.cache_service import CacheService
 from domain.exceptions import (
     ValidationError,
     NotFoundError,
     BusinessRuleViolationError,
     ConcurrencyError
 )
-from decimal import Decimal
+from domain.enums import BidStatus
+from domain.constants import MAX_PAGE_SIZE
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
 import uuid
 
 # Create blueprint
 bid_bp = Blueprint('bids', __name__, url_prefix='/api/v1/bids')
 
+_CENT = Decimal('0.01')
+_AMOUNT_LIMIT = Decimal('1e10')  # DECIMAL(12,2) holds at most 10 integer digits
+
+
+def _parse_amount(raw) -> Decimal:
+    """Parse a request amount once into an exact 2-decimal Decimal (DECIMAL(12,2))"""
+    try:
+        amount = Decimal(str(raw))
+    except InvalidOperation:
+        raise ValueError("Invalid amount format")
+    
+    # Range check first: quantize raises InvalidOperation past the context precision
+    if not amount.is_finite() or abs(amount) >= _AMOUNT_LIMIT or amount != amount.quantize(_CENT):
+        raise ValueError("Invalid amount format")
+    
+    return amount.quantize(_CENT)
+
 def get_bidding_service():
     """Get bidding service instance"""
     session = get_db_session()
@@ -27,7 +48,7 @@ def get_bidding_service():
     session_repo = AuctionSessionRepository(session)
     session_item_repo = SessionItemRepository(session)
     enrollment_repo = EnrollmentRepository(session)
-    return BiddingService(bid_repo, session_repo, session_item_repo, enrollment_repo)
+    return BiddingService(bid_repo, session_repo, session_item_repo, enrollment_repo, CacheService())
 
 
 @bid_bp.route('', methods=['POST'])
@@ -94,7 +115,7 @@ def place_bid():
         user_id = get_current_user()
         session_id = data['session_id']
         session_item_id = data['session_item_id']
-        amount = Decimal(str(data['amount']))
+        amount = _parse_amount(data['amount'])
         
         # Get idempotency key from header or body
         idempotency_key = request.headers.get('Idempotency-Key') or data.get('idempotency_key')
@@ -123,9 +144,6 @@ def place_bid():
         return jsonify({'error': str(e)}), 409
     except ValueError as e:
         return jsonify({'error': 'Invalid amount format'}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error placing bid: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @bid_bp.route('/<bid_id>', methods=['GET'])
@@ -151,21 +169,16 @@ def get_bid(bid_id):
       404:
         description: Bid not found
     """
-    try:
-        bidding_service = get_bidding_service()
-        result = bidding_service.get_bid(bid_id)
-        
-        if not result:
-            return jsonify({'error': 'Bid not found'}), 404
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting bid: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_bid(bid_id)
+    
+    if not result:
+        return jsonify({'error': 'Bid not found'}), 404
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @bid_bp.route('/sessions/<session_id>', methods=['GET'])
@@ -188,27 +201,72 @@ def get_session_bids(session_id):
         name: page_size
         type: integer
         default: 50
+      - in: query
+        name: status
+        type: string
+        enum: [VALID, INVALID, OUTBID, WINNING]
+      - in: query
+        name: before
+        type: string
+        description: Cursor (next_cursor from the previous page, "<placed_at>|<bid_id>"); returns bids placed before it
     responses:
       200:
         description: List of bids for the session
+      400:
+        description: Invalid status or cursor
       404:
         description: Session not found
     """
+    page = int(request.args.get('page', 1))
+    page_size = int(request.args.get('page_size', 50))
+    
+    status_param = request.args.get('status')
+    before_param = request.args.get('before')
     try:
-        page = int(request.args.get('page', 1))
-        page_size = int(request.args.get('page_size', 50))
-        
-        bidding_service = get_bidding_service()
-        result = bidding_service.get_session_bids(session_id, page, page_size)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting session bids: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+        status = BidStatus(status_param.upper()) if status_param else None
+        before = None
+        if before_param:
+            before_placed_at, _, before_id = before_param.partition('|')
+            if not before_id:
+                raise ValueError("Cursor is missing the bid id")
+            before = (datetime.fromisoformat(before_placed_at), before_id)
+    except ValueError:
+        return jsonify({'error': 'Invalid status or cursor'}), 400
+    
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_session_bids(
+        session_id, page, page_size, status=status, before=before
+    )
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
+
+
+@bid_bp.route('/sessions/<session_id>/statistics', methods=['GET'])
+def get_session_statistics(session_id):
+    """
+    Get bidding statistics for an auction session
+    ---
+    tags:
+      - Bidding
+    parameters:
+      - in: path
+        name: session_id
+        type: string
+        required: true
+    responses:
+      200:
+        description: Session bidding statistics
+    """
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_session_statistics(session_id)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @bid_bp.route('/items/<session_item_id>', methods=['GET'])
@@ -237,21 +295,16 @@ def get_session_item_bids(session_item_id):
       404:
         description: Session item not found
     """
-    try:
-        page = int(request.args.get('page', 1))
-        page_size = int(request.args.get('page_size', 50))
-        
-        bidding_service = get_bidding_service()
-        result = bidding_service.get_session_item_bids(session_item_id, page, page_size)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting session item bids: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    page = int(request.args.get('page', 1))
+    page_size = int(request.args.get('page_size', 50))
+    
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_session_item_bids(session_item_id, page, page_size)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @bid_bp.route('/items/<session_item_id>/highest', methods=['GET'])
@@ -272,25 +325,20 @@ def get_highest_bid(session_item_id):
       404:
         description: No bids found for this item
     """
-    try:
-        bidding_service = get_bidding_service()
-        result = bidding_service.get_current_highest_bid(session_item_id)
-        
-        if not result:
-            return jsonify({
-                'success': True,
-                'data': None,
-                'message': 'No bids placed yet'
-            })
-        
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_current_highest_bid(session_item_id)
+    
+    if not result:
         return jsonify({
             'success': True,
-            'data': result
+            'data': None,
+            'message': 'No bids placed yet'
         })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting highest bid: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @bid_bp.route('/items/<session_item_id>/history', methods=['GET'])
@@ -309,25 +357,22 @@ def get_bid_history(session_item_id):
         name: limit
         type: integer
         default: 10
+        maximum: 100
         description: Number of recent bids to return
     responses:
       200:
         description: Bid history for the item
     """
-    try:
-        limit = int(request.args.get('limit', 10))
-        
-        bidding_service = get_bidding_service()
-        result = bidding_service.get_bid_history(session_item_id, limit)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting bid history: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    # Cap the window so one request cannot materialize an unbounded history
+    limit = min(int(request.args.get('limit', 10)), MAX_PAGE_SIZE)
+    
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_bid_history(session_item_id, limit)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @bid_bp.route('/my-bids', methods=['GET'])
@@ -359,23 +404,45 @@ def get_my_bids():
       401:
         description: Authentication required
     """
-    try:
-        user_id = get_current_user()
-        session_id = request.args.get('session_id')
-        page = int(request.args.get('page', 1))
-        page_size = int(request.args.get('page_size', 50))
-        
-        bidding_service = get_bidding_service()
-        result = bidding_service.get_user_bids(user_id, session_id, page, page_size)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting user bids: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    user_id = get_current_user()
+    session_id = request.args.get('session_id')
+    page = int(request.args.get('page', 1))
+    page_size = int(request.args.get('page_size', 50))
+    
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_user_bids(user_id, session_id, page, page_size)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
+
+
+@bid_bp.route('/my-bids/summary', methods=['GET'])
+@jwt_required
+def get_my_bid_summary():
+    """
+    Get current user's bidding summary
+    ---
+    tags:
+      - Bidding
+    security:
+      - Bearer: []
+    responses:
+      200:
+        description: Aggregated bid counts and amounts for the user
+      401:
+        description: Authentication required
+    """
+    user_id = get_current_user()
+    
+    bidding_service = get_bidding_service()
+    result = bidding_service.get_user_bid_summary(user_id)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @bid_bp.route('/sessions/<session_id>/items/<item_id>/bids', methods=['GET'])
@@ -446,7 +513,7 @@ def get_session_item_bids_detailed(session_id, item_id):
             'code': 'NOT_FOUND'
         }), 404
     except Exception as e:
-        current_app.logger.error(f"Get session item bids error: {str(e)}")
+        current_app.logger.error("Get session item bids error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to retrieve bids',
@@ -493,6 +560,8 @@ def place_session_item_bid(session_id, item_id):
         description: Authentication required
       404:
         description: Session or item not found
+      409:
+        description: Concurrent bid conflict
     """
     try:
         data = request.get_json()
@@ -505,7 +574,7 @@ def place_session_item_bid(session_id, item_id):
             }), 400
 
         user_id = get_current_user()
-        amount = Decimal(str(data['amount']))
+        amount = _parse_amount(data['amount'])
 
         bidding_service = get_bidding_service()
         result = bidding_service.place_session_item_bid(session_id, item_id, user_id, amount)
@@ -534,8 +603,20 @@ def place_session_item_bid(session_id, item_id):
             'error': str(e),
             'code': 'VALIDATION_ERROR'
         }), 400
+    except ConcurrencyError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'code': 'BID_CONFLICT'
+        }), 409
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid amount format',
+            'code': 'INVALID_AMOUNT'
+        }), 400
     except Exception as e:
-        current_app.logger.error(f"Place session item bid error: {str(e)}")
+        current_app.logger.error("Place session item bid error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to place bid',
@@ -18,6 +18,9 @@ from domain.exceptions import (
 # Create blueprint
 jewelry_bp = Blueprint('jewelry', __name__, url_prefix='/api/v1/jewelry')
 
+# Status lookup for query-string filters
+_STATUS_BY_NAME = {s.value: s for s in JewelryStatus}
+
 def get_jewelry_service():
     """Get jewelry service instance"""
     session = get_db_session()
@@ -110,7 +113,7 @@ def submit_sell_request():
             'code': 'VALIDATION_ERROR'
         }), 400
     except Exception as e:
-        current_app.logger.error(f"Submit sell request error: {str(e)}")
+        current_app.logger.error("Submit sell request error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to submit sell request',
@@ -206,7 +209,7 @@ def create_jewelry_item():
             'code': 'NOT_AUTHORIZED'
         }), 403
     except Exception as e:
-        current_app.logger.error(f"Create jewelry item error: {str(e)}")
+        current_app.logger.error("Create jewelry item error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to create jewelry item',
@@ -271,9 +274,9 @@ def list_jewelry_items():
         
         if request.args.get('status'):
             try:
-                status = JewelryStatus(request.args.get('status'))
+                status = _STATUS_BY_NAME[request.args.get('status')]
                 filters['status'] = status
-            except ValueError:
+            except KeyError:
                 pass
         
         if request.args.get('search'):
@@ -300,7 +303,7 @@ def list_jewelry_items():
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"List jewelry items error: {str(e)}")
+        current_app.logger.error("List jewelry items error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to retrieve jewelry items',
@@ -343,7 +346,7 @@ def get_jewelry_item(item_id):
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Get jewelry item error: {str(e)}")
+        current_app.logger.error("Get jewelry item error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to retrieve jewelry item',
@@ -386,7 +389,7 @@ def get_jewelry_by_code(code):
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Get jewelry by code error: {str(e)}")
+        current_app.logger.error("Get jewelry by code error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to retrieve jewelry item',
@@ -433,7 +436,7 @@ def get_my_jewelry_items():
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Get my jewelry items error: {str(e)}")
+        current_app.logger.error("Get my jewelry items error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to retrieve jewelry items',
@@ -512,7 +515,7 @@ def update_jewelry_item(item_id):
             'code': 'NOT_AUTHORIZED'
         }), 403
     except Exception as e:
-        current_app.logger.error(f"Update jewelry item error: {str(e)}")
+        current_app.logger.error("Update jewelry item error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to update jewelry item',
@@ -1,7 +1,7 @@
 """
 Payment API controller for the Jewelry Auction System
 """
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError as MarshmallowValidationError
 from api.middleware.auth_middleware import jwt_required, staff_required, get_current_user
 from services.payment_service import PaymentService
@@ -115,9 +115,6 @@ def create_payment():
         return jsonify({'error': str(e)}), 404
     except ValueError as e:
         return jsonify({'error': 'Invalid payment method'}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error creating payment: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @payment_bp.route('/<payment_id>/process', methods=['POST'])
@@ -183,9 +180,6 @@ def process_payment(payment_id):
         return jsonify({'error': str(e)}), 400
     except NotFoundError as e:
         return jsonify({'error': str(e)}), 404
-    except Exception as e:
-        current_app.logger.error(f"Error processing payment: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @payment_bp.route('/<payment_id>', methods=['GET'])
@@ -211,21 +205,16 @@ def get_payment(payment_id):
       404:
         description: Payment not found
     """
-    try:
-        payment_service = get_payment_service()
-        result = payment_service.get_payment(payment_id)
-        
-        if not result:
-            return jsonify({'error': 'Payment not found'}), 404
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting payment: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    payment_service = get_payment_service()
+    result = payment_service.get_payment(payment_id)
+    
+    if not result:
+        return jsonify({'error': 'Payment not found'}), 404
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @payment_bp.route('/my-payments', methods=['GET'])
@@ -253,22 +242,17 @@ def get_my_payments():
       401:
         description: Authentication required
     """
-    try:
-        user_id = get_current_user()
-        page = int(request.args.get('page', 1))
-        page_size = int(request.args.get('page_size', 20))
-        
-        payment_service = get_payment_service()
-        result = payment_service.get_user_payments(user_id, page, page_size)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting user payments: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    user_id = get_current_user()
+    page = int(request.args.get('page', 1))
+    page_size = int(request.args.get('page_size', 20))
+    
+    payment_service = get_payment_service()
+    result = payment_service.get_user_payments(user_id, page, page_size)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @payment_bp.route('/<payment_id>/refund', methods=['POST'])
@@ -343,9 +327,6 @@ def create_refund(payment_id):
         return jsonify({'error': str(e)}), 404
     except ValueError as e:
         return jsonify({'error': 'Invalid amount format'}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error creating refund: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
 
 
 @payment_bp.route('/payouts/my-payouts', methods=['GET'])
@@ -373,22 +354,17 @@ def get_my_payouts():
       401:
         description: Authentication required
     """
-    try:
-        user_id = get_current_user()
-        page = int(request.args.get('page', 1))
-        page_size = int(request.args.get('page_size', 20))
-        
-        payment_service = get_payment_service()
-        result = payment_service.get_user_payouts(user_id, page, page_size)
-        
-        return jsonify({
-            'success': True,
-            'data': result
-        })
-        
-    except Exception as e:
-        current_app.logger.error(f"Error getting user payouts: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    user_id = get_current_user()
+    page = int(request.args.get('page', 1))
+    page_size = int(request.args.get('page_size', 20))
+    
+    payment_service = get_payment_service()
+    result = payment_service.get_user_payouts(user_id, page, page_size)
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    })
 
 
 @payment_bp.route('/sessions/<session_id>/settle', methods=['POST'])
@@ -438,6 +414,3 @@ def settle_session(session_id):
         return jsonify({'error': str(e)}), 400
     except AuthorizationError as e:
         return jsonify({'error': str(e)}), 403
-    except Exception as e:
-        current_app.logger.error(f"Error settling session: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
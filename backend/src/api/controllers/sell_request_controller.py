@@ -19,6 +19,9 @@ from domain.exceptions import (
 # Create blueprint
 sell_request_bp = Blueprint('sell_requests', __name__, url_prefix='/api/v1/sell-requests')
 
+# Status lookup for query-string filters
+_STATUS_BY_NAME = {s.value: s for s in SellRequestStatus}
+
 def get_jewelry_service():
     """Get jewelry service instance"""
     session = get_db_session()
@@ -127,7 +130,7 @@ def create_sell_request():
             'code': 'VALIDATION_ERROR'
         }), 400
     except Exception as e:
-        current_app.logger.error(f"Create sell request error: {str(e)}")
+        current_app.logger.error("Create sell request error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to create sell request',
@@ -190,9 +193,9 @@ def list_sell_requests():
         
         if request.args.get('status'):
             try:
-                status = SellRequestStatus(request.args.get('status'))
+                status = _STATUS_BY_NAME[request.args.get('status')]
                 filters['status'] = status
-            except ValueError:
+            except KeyError:
                 return jsonify({
                     'success': False,
                     'error': 'Invalid status value',
@@ -208,7 +211,7 @@ def list_sell_requests():
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"List sell requests error: {str(e)}")
+        current_app.logger.error("List sell requests error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to retrieve sell requests',
@@ -286,7 +289,7 @@ def final_approve_sell_request(request_id):
             'code': 'BUSINESS_RULE_VIOLATION'
         }), 403
     except Exception as e:
-        current_app.logger.error(f"Final approve sell request error: {str(e)}")
+        current_app.logger.error("Final approve sell request error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to approve sell request',
@@ -154,7 +154,7 @@ def upload_image():
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Image upload error: {str(e)}")
+        current_app.logger.error("Image upload error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to upload image',
@@ -261,7 +261,7 @@ def upload_document():
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Document upload error: {str(e)}")
+        current_app.logger.error("Document upload error: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to upload document',
@@ -297,7 +297,7 @@ def serve_file(filename):
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"File serve error: {str(e)}")
+        current_app.logger.error("File serve error: %s", e)
         return jsonify({
             'error': 'File not found'
         }), 404
@@ -31,7 +31,7 @@ def _decode_jwt_token(token: str) -> dict:
         try:
             return AuthService.validate_access_token(token)
         except Exception as e:
-            current_app.logger.error(f"JWT decode error: {str(e)}")
+            current_app.logger.error("JWT decode error: %s", e)
             raise InvalidCredentialsError()
 
 
@@ -41,7 +41,7 @@ def _get_user_id_from_email(email: str) -> Optional[str]:
         user = db.session.query(UserModel).filter_by(email=email).first()
         return user.id if user else None
     except Exception as e:
-        current_app.logger.warning(f"Failed to lookup user by email {email}: {e}")
+        current_app.logger.warning("Failed to lookup user by email %s: %s", email, e)
         return None
 
 
@@ -96,7 +96,7 @@ def jwt_required(f: Callable) -> Callable:
                 'code': 'INVALID_TOKEN'
             }), 401
         except Exception as e:
-            current_app.logger.error(f"Authentication error: {str(e)}")
+            current_app.logger.error("Authentication error: %s", e)
             return jsonify({
                 'error': 'Authentication failed',
                 'code': 'AUTH_ERROR'
@@ -123,7 +123,7 @@ def role_required(required_roles: List[UserRole]) -> Callable:
                 return f(*args, **kwargs)
                 
             except Exception as e:
-                current_app.logger.error(f"Authorization error: {str(e)}")
+                current_app.logger.error("Authorization error: %s", e)
                 return jsonify({
                     'error': 'Authorization failed',
                     'code': 'AUTH_ERROR'
@@ -200,7 +200,7 @@ def optional_auth(f: Callable) -> Callable:
             
         except Exception as e:
             # If token validation fails, treat as guest
-            current_app.logger.warning(f"Optional auth failed: {str(e)}")
+            current_app.logger.warning("Optional auth failed: %s", e)
             g.current_user_id = None
             g.current_user_role = UserRole.GUEST
             g.token_payload = None
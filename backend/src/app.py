@@ -17,9 +17,10 @@ load_dotenv()
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
-from config import config_by_name
+from config import config_by_name, swagger_settings
 from infrastructure.databases.mssql import init_mssql, db
 from flasgger import Swagger
+from werkzeug.exceptions import HTTPException
 
 
 def create_app():
@@ -43,46 +44,7 @@ def create_app():
         print(f"❌ Database initialization failed: {e}")
 
     # Initialize Swagger
-    swagger_config = {
-        "headers": [],
-        "specs": [
-            {
-                "endpoint": 'apispec',
-                "route": '/apispec.json',
-                "rule_filter": lambda rule: True,
-                "model_filter": lambda tag: True,
-            }
-        ],
-        "static_url_path": "/flasgger_static",
-        "swagger_ui": True,
-        "specs_route": "/api/docs"
-    }
-
-    swagger_template = {
-        "swagger": "2.0",
-        "info": {
-            "title": "Jewelry Auction System API",
-            "description": "API for jewelry auction system",
-            "version": "1.0.0"
-        },
-        "basePath": "/api/v1",
-        "schemes": ["http", "https"],
-        "securityDefinitions": {
-            "Bearer": {
-                "type": "apiKey",
-                "name": "Authorization",
-                "in": "header",
-                "description": "JWT Authorization header using the Bearer scheme. Example: \"Authorization: Bearer {token}\""
-            }
-        },
-        "security": [
-            {
-                "Bearer": []
-            }
-        ]
-    }
-
-    swagger = Swagger(app, config=swagger_config, template=swagger_template)
+    swagger = Swagger(app, config=swagger_settings.swagger_config, template=swagger_settings.template)
 
     # JWT error handlers
     @jwt.expired_token_loader
@@ -97,6 +59,14 @@ def create_app():
     def missing_token_callback(error):
         return jsonify({'error': 'Authentication required'}), 401
 
+    # Unhandled errors: log once with traceback, keep the JSON error shape
+    @app.errorhandler(Exception)
+    def unhandled_exception_callback(error):
+        if isinstance(error, HTTPException):
+            return error
+        app.logger.exception("Unhandled error on %s %s", request.method, request.path)
+        return jsonify({'error': 'Internal server error'}), 500
+
     # Handle preflight requests
     @app.before_request
     def handle_preflight():
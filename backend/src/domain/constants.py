@@ -16,6 +16,8 @@ MIN_BID_INCREMENT = 1.00
 DEFAULT_SESSION_DURATION_HOURS = 2
 MAX_SESSION_DURATION_HOURS = 24
 MIN_RESERVE_PRICE = 1.00
+BID_CONFLICT_MAX_ATTEMPTS = 3  # optimistic version conflicts retried before returning 409
+BID_CONFLICT_BACKOFF_SECONDS = 0.05
 
 # User settings
 MIN_PASSWORD_LENGTH = 8
@@ -64,6 +66,8 @@ API_RATE_LIMIT_PER_HOUR = 1000
 # Cache settings
 CACHE_TTL_SECONDS = 300  # 5 minutes
 CACHE_TTL_LONG_SECONDS = 3600  # 1 hour
+SESSION_STATS_CACHE_TTL_SECONDS = 5  # live auctions, polled frequently
+SESSION_CACHE_TTL_SECONDS = 2  # session/item reads; evicted on every write
 
 # Audit log retention
 AUDIT_LOG_RETENTION_DAYS = 365
@@ -6,6 +6,32 @@ from typing import Optional, Dict, Any, List
 from domain.enums import SessionStatus
 
 
+# Allowed status transitions, built once at import
+_VALID_TRANSITIONS = {
+    SessionStatus.DRAFT: frozenset((
+        SessionStatus.SCHEDULED,
+        SessionStatus.CANCELED,
+    )),
+    SessionStatus.SCHEDULED: frozenset((
+        SessionStatus.OPEN,
+        SessionStatus.CANCELED,
+    )),
+    SessionStatus.OPEN: frozenset((
+        SessionStatus.PAUSED,
+        SessionStatus.CLOSED,
+    )),
+    SessionStatus.PAUSED: frozenset((
+        SessionStatus.OPEN,
+        SessionStatus.CLOSED,
+    )),
+    SessionStatus.CLOSED: frozenset((
+        SessionStatus.SETTLED,
+    )),
+    SessionStatus.SETTLED: frozenset(),  # Final state
+    SessionStatus.CANCELED: frozenset()  # Final state
+}
+
+
 class AuctionSession:
     """Auction Session domain entity"""
     
@@ -36,7 +62,7 @@ class AuctionSession:
         self.assigned_staff_id = assigned_staff_id
         self.rules = rules or {}
         self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.updated_at = updated_at or self.created_at
         self.opened_at = opened_at
         self.closed_at = closed_at
         self.settled_at = settled_at
@@ -44,48 +70,25 @@ class AuctionSession:
     def update_status(self, new_status: SessionStatus):
         """Update session status with validation"""
         if self.can_transition_to(new_status):
+            now = datetime.utcnow()
             old_status = self.status
             self.status = new_status
-            self.updated_at = datetime.utcnow()
+            self.updated_at = now
             
             # Set specific timestamps
             if new_status == SessionStatus.OPEN:
-                self.opened_at = datetime.utcnow()
+                self.opened_at = now
             elif new_status == SessionStatus.CLOSED:
-                self.closed_at = datetime.utcnow()
+                self.closed_at = now
             elif new_status == SessionStatus.SETTLED:
-                self.settled_at = datetime.utcnow()
+                self.settled_at = now
                 
         else:
             raise ValueError(f"Cannot transition from {self.status.value} to {new_status.value}")
     
     def can_transition_to(self, new_status: SessionStatus) -> bool:
         """Check if status transition is valid"""
-        valid_transitions = {
-            SessionStatus.DRAFT: [
-                SessionStatus.SCHEDULED,
-                SessionStatus.CANCELED
-            ],
-            SessionStatus.SCHEDULED: [
-                SessionStatus.OPEN,
-                SessionStatus.CANCELED
-            ],
-            SessionStatus.OPEN: [
-                SessionStatus.PAUSED,
-                SessionStatus.CLOSED
-            ],
-            SessionStatus.PAUSED: [
-                SessionStatus.OPEN,
-                SessionStatus.CLOSED
-            ],
-            SessionStatus.CLOSED: [
-                SessionStatus.SETTLED
-            ],
-            SessionStatus.SETTLED: [],  # Final state
-            SessionStatus.CANCELED: []  # Final state
-        }
-        
-        return new_status in valid_transitions.get(self.status, [])
+        return new_status in _VALID_TRANSITIONS.get(self.status, ())
     
     def schedule(self, start_at: datetime, end_at: datetime):
         """Schedule the auction session"""
@@ -7,9 +7,33 @@ from decimal import Decimal
 from domain.enums import BidStatus
 
 
+# Allowed status transitions, built once at import
+_VALID_TRANSITIONS = {
+    BidStatus.VALID: frozenset((
+        BidStatus.OUTBID,
+        BidStatus.WINNING,
+        BidStatus.INVALID,
+    )),
+    BidStatus.OUTBID: frozenset((
+        BidStatus.INVALID,  # Can be invalidated later
+    )),
+    BidStatus.WINNING: frozenset((
+        BidStatus.OUTBID,
+        BidStatus.INVALID,
+    )),
+    BidStatus.INVALID: frozenset()  # Final state
+}
+
+
 class Bid:
     """Bid domain entity"""
     
+    __slots__ = (
+        'id', 'session_id', 'session_item_id', 'bidder_id', 'amount',
+        'placed_at', 'is_auto', 'status', 'idempotency_key',
+        'created_at', 'updated_at'
+    )
+    
     def __init__(
         self,
         id: Optional[str] = None,
@@ -20,6 +44,7 @@ class Bid:
         placed_at: Optional[datetime] = None,
         is_auto: bool = False,
         status: BidStatus = BidStatus.VALID,
+        idempotency_key: Optional[str] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
@@ -31,8 +56,9 @@ class Bid:
         self.placed_at = placed_at or datetime.utcnow()
         self.is_auto = is_auto
         self.status = status
+        self.idempotency_key = idempotency_key
         self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.updated_at = updated_at or self.created_at
     
     def update_status(self, new_status: BidStatus):
         """Update bid status"""
@@ -44,23 +70,7 @@ class Bid:
     
     def can_transition_to(self, new_status: BidStatus) -> bool:
         """Check if status transition is valid"""
-        valid_transitions = {
-            BidStatus.VALID: [
-                BidStatus.OUTBID,
-                BidStatus.WINNING,
-                BidStatus.INVALID
-            ],
-            BidStatus.OUTBID: [
-                BidStatus.INVALID  # Can be invalidated later
-            ],
-            BidStatus.WINNING: [
-                BidStatus.OUTBID,
-                BidStatus.INVALID
-            ],
-            BidStatus.INVALID: []  # Final state
-        }
-        
-        return new_status in valid_transitions.get(self.status, [])
+        return new_status in _VALID_TRANSITIONS.get(self.status, ())
     
     def mark_as_outbid(self):
         """Mark bid as outbid by a higher bid"""
@@ -142,7 +152,7 @@ class SessionItem:
         self.current_winner_id = current_winner_id
         self.bid_count = bid_count
         self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.updated_at = updated_at or self.created_at
     
     def update_highest_bid(self, bid_amount: Decimal, bidder_id: str):
         """Update the highest bid for this item"""
@@ -57,11 +57,12 @@ class Enrollment:
         if not self.has_paid_deposit():
             raise ValueError("Cannot approve enrollment without deposit payment")
         
+        now = datetime.utcnow()
         self.status = EnrollmentStatus.APPROVED
         self.approved_by = approved_by
-        self.approved_date = datetime.utcnow()
+        self.approved_date = now
         self.paddle_number = paddle_number
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
     def reject(self, reason: str) -> None:
         """Reject the enrollment"""
@@ -79,9 +80,10 @@ class Enrollment:
         if amount != self.deposit_amount:
             raise ValueError("Payment amount must match required deposit")
         
+        now = datetime.utcnow()
         self.deposit_paid = True
-        self.deposit_payment_date = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.deposit_payment_date = now
+        self.updated_at = now
     
     def to_dict(self) -> dict:
         """Convert to dictionary representation"""
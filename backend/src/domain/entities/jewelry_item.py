@@ -7,9 +7,43 @@ from decimal import Decimal
 from domain.enums import JewelryStatus
 
 
+# Allowed status transitions, built once at import
+_VALID_TRANSITIONS = {
+    JewelryStatus.PENDING_APPRAISAL: frozenset((
+        JewelryStatus.APPRAISED,
+        JewelryStatus.WITHDRAWN,
+    )),
+    JewelryStatus.APPRAISED: frozenset((
+        JewelryStatus.APPROVED,
+        JewelryStatus.WITHDRAWN,
+    )),
+    JewelryStatus.APPROVED: frozenset((
+        JewelryStatus.IN_AUCTION,
+        JewelryStatus.WITHDRAWN,
+    )),
+    JewelryStatus.IN_AUCTION: frozenset((
+        JewelryStatus.SOLD,
+        JewelryStatus.UNSOLD,
+    )),
+    JewelryStatus.UNSOLD: frozenset((
+        JewelryStatus.APPROVED,  # Can be re-listed
+        JewelryStatus.RETURNED,
+    )),
+    JewelryStatus.SOLD: frozenset(),  # Final state
+    JewelryStatus.RETURNED: frozenset(),  # Final state
+    JewelryStatus.WITHDRAWN: frozenset()  # Final state
+}
+
+
 class JewelryItem:
     """Jewelry Item domain entity"""
     
+    __slots__ = (
+        'id', 'code', 'title', 'description', 'attributes', 'weight',
+        '_photos', 'owner_user_id', 'status', 'estimated_price',
+        'reserve_price', 'created_at', 'updated_at'
+    )
+    
     def __init__(
         self,
         id: Optional[str] = None,
@@ -32,24 +66,34 @@ class JewelryItem:
         self.description = description
         self.attributes = attributes or {}
         self.weight = weight
-        self.photos = photos or []
+        # Insertion-ordered dict keys: O(1) membership, add and remove
+        self._photos = dict.fromkeys(photos or ())
         self.owner_user_id = owner_user_id
         self.status = status
         self.estimated_price = estimated_price
         self.reserve_price = reserve_price
         self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.updated_at = updated_at or self.created_at
+    
+    @property
+    def photos(self) -> List[str]:
+        """Photo URLs in the order they were added"""
+        return list(self._photos)
+    
+    @photos.setter
+    def photos(self, photo_urls: Optional[List[str]]):
+        self._photos = dict.fromkeys(photo_urls or ())
     
     def add_photo(self, photo_url: str):
         """Add a photo to the jewelry item"""
-        if photo_url not in self.photos:
-            self.photos.append(photo_url)
+        if photo_url not in self._photos:
+            self._photos[photo_url] = None
             self.updated_at = datetime.utcnow()
     
     def remove_photo(self, photo_url: str):
         """Remove a photo from the jewelry item"""
-        if photo_url in self.photos:
-            self.photos.remove(photo_url)
+        if photo_url in self._photos:
+            del self._photos[photo_url]
             self.updated_at = datetime.utcnow()
     
     def update_attributes(self, attributes: Dict[str, Any]):
@@ -76,33 +120,7 @@ class JewelryItem:
     
     def can_transition_to(self, new_status: JewelryStatus) -> bool:
         """Check if status transition is valid"""
-        valid_transitions = {
-            JewelryStatus.PENDING_APPRAISAL: [
-                JewelryStatus.APPRAISED,
-                JewelryStatus.WITHDRAWN
-            ],
-            JewelryStatus.APPRAISED: [
-                JewelryStatus.APPROVED,
-                JewelryStatus.WITHDRAWN
-            ],
-            JewelryStatus.APPROVED: [
-                JewelryStatus.IN_AUCTION,
-                JewelryStatus.WITHDRAWN
-            ],
-            JewelryStatus.IN_AUCTION: [
-                JewelryStatus.SOLD,
-                JewelryStatus.UNSOLD
-            ],
-            JewelryStatus.UNSOLD: [
-                JewelryStatus.APPROVED,  # Can be re-listed
-                JewelryStatus.RETURNED
-            ],
-            JewelryStatus.SOLD: [],  # Final state
-            JewelryStatus.RETURNED: [],  # Final state
-            JewelryStatus.WITHDRAWN: []  # Final state
-        }
-        
-        return new_status in valid_transitions.get(self.status, [])
+        return new_status in _VALID_TRANSITIONS.get(self.status, ())
     
     def is_available_for_auction(self) -> bool:
         """Check if item is available for auction"""
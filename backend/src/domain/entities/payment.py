@@ -71,11 +71,12 @@ class Payment:
     
     def complete_payment(self, transaction_id: str, gateway_response: Optional[str] = None) -> None:
         """Mark payment as completed"""
+        now = datetime.utcnow()
         self.status = PaymentStatus.COMPLETED
         self.transaction_id = transaction_id
         self.payment_gateway_response = gateway_response
-        self.payment_date = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.payment_date = now
+        self.updated_at = now
     
     def fail_payment(self, reason: str) -> None:
         """Mark payment as failed"""
@@ -68,11 +68,12 @@ class Payout:
     
     def complete_payout(self, transaction_id: str, gateway_response: Optional[str] = None) -> None:
         """Mark payout as completed"""
+        now = datetime.utcnow()
         self.status = PayoutStatus.COMPLETED
         self.transaction_id = transaction_id
         self.payment_gateway_response = gateway_response
-        self.payout_date = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.payout_date = now
+        self.updated_at = now
     
     def fail_payout(self, reason: str) -> None:
         """Mark payout as failed"""
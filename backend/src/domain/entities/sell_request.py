@@ -6,6 +6,36 @@ from typing import Optional
 from domain.enums import SellRequestStatus
 
 
+# Allowed status transitions, built once at import
+_VALID_TRANSITIONS = {
+    SellRequestStatus.SUBMITTED: frozenset((
+        SellRequestStatus.PRELIM_APPRAISED,
+        SellRequestStatus.REJECTED,
+    )),
+    SellRequestStatus.PRELIM_APPRAISED: frozenset((
+        SellRequestStatus.RECEIVED,
+        SellRequestStatus.REJECTED,
+    )),
+    SellRequestStatus.RECEIVED: frozenset((
+        SellRequestStatus.FINAL_APPRAISED,
+        SellRequestStatus.REJECTED,
+    )),
+    SellRequestStatus.FINAL_APPRAISED: frozenset((
+        SellRequestStatus.MANAGER_APPROVED,
+        SellRequestStatus.REJECTED,
+    )),
+    SellRequestStatus.MANAGER_APPROVED: frozenset((
+        SellRequestStatus.SELLER_ACCEPTED,
+        SellRequestStatus.REJECTED,
+    )),
+    SellRequestStatus.SELLER_ACCEPTED: frozenset((
+        SellRequestStatus.ASSIGNED_TO_SESSION,
+    )),
+    SellRequestStatus.ASSIGNED_TO_SESSION: frozenset(),  # Final state
+    SellRequestStatus.REJECTED: frozenset()  # Final state
+}
+
+
 class SellRequest:
     """Sell Request domain entity for jewelry consignment"""
     
@@ -35,7 +65,7 @@ class SellRequest:
         self.staff_notes = staff_notes
         self.manager_notes = manager_notes
         self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.updated_at = updated_at or self.created_at
         self.submitted_at = submitted_at
         self.appraised_at = appraised_at
         self.approved_at = approved_at
@@ -44,19 +74,20 @@ class SellRequest:
     def update_status(self, new_status: SellRequestStatus, notes: str = ""):
         """Update sell request status with validation"""
         if self.can_transition_to(new_status):
+            now = datetime.utcnow()
             old_status = self.status
             self.status = new_status
-            self.updated_at = datetime.utcnow()
+            self.updated_at = now
             
             # Set specific timestamps
             if new_status == SellRequestStatus.SUBMITTED:
-                self.submitted_at = datetime.utcnow()
+                self.submitted_at = now
             elif new_status == SellRequestStatus.FINAL_APPRAISED:
-                self.appraised_at = datetime.utcnow()
+                self.appraised_at = now
             elif new_status == SellRequestStatus.MANAGER_APPROVED:
-                self.approved_at = datetime.utcnow()
+                self.approved_at = now
             elif new_status == SellRequestStatus.SELLER_ACCEPTED:
-                self.accepted_at = datetime.utcnow()
+                self.accepted_at = now
             
             # Add notes if provided
             if notes:
@@ -67,59 +98,34 @@ class SellRequest:
     
     def can_transition_to(self, new_status: SellRequestStatus) -> bool:
         """Check if status transition is valid"""
-        valid_transitions = {
-            SellRequestStatus.SUBMITTED: [
-                SellRequestStatus.PRELIM_APPRAISED,
-                SellRequestStatus.REJECTED
-            ],
-            SellRequestStatus.PRELIM_APPRAISED: [
-                SellRequestStatus.RECEIVED,
-                SellRequestStatus.REJECTED
-            ],
-            SellRequestStatus.RECEIVED: [
-                SellRequestStatus.FINAL_APPRAISED,
-                SellRequestStatus.REJECTED
-            ],
-            SellRequestStatus.FINAL_APPRAISED: [
-                SellRequestStatus.MANAGER_APPROVED,
-                SellRequestStatus.REJECTED
-            ],
-            SellRequestStatus.MANAGER_APPROVED: [
-                SellRequestStatus.SELLER_ACCEPTED,
-                SellRequestStatus.REJECTED
-            ],
-            SellRequestStatus.SELLER_ACCEPTED: [
-                SellRequestStatus.ASSIGNED_TO_SESSION
-            ],
-            SellRequestStatus.ASSIGNED_TO_SESSION: [],  # Final state
-            SellRequestStatus.REJECTED: []  # Final state
-        }
-        
-        return new_status in valid_transitions.get(self.status, [])
+        return new_status in _VALID_TRANSITIONS.get(self.status, ())
     
     def add_notes(self, notes: str):
         """Add notes to the request"""
+        now = datetime.utcnow()
         if self.notes:
-            self.notes += f"\n{datetime.utcnow().isoformat()}: {notes}"
+            self.notes += f"\n{now.isoformat()}: {notes}"
         else:
-            self.notes = f"{datetime.utcnow().isoformat()}: {notes}"
-        self.updated_at = datetime.utcnow()
+            self.notes = f"{now.isoformat()}: {notes}"
+        self.updated_at = now
     
     def add_staff_notes(self, notes: str):
         """Add staff-specific notes"""
+        now = datetime.utcnow()
         if self.staff_notes:
-            self.staff_notes += f"\n{datetime.utcnow().isoformat()}: {notes}"
+            self.staff_notes += f"\n{now.isoformat()}: {notes}"
         else:
-            self.staff_notes = f"{datetime.utcnow().isoformat()}: {notes}"
-        self.updated_at = datetime.utcnow()
+            self.staff_notes = f"{now.isoformat()}: {notes}"
+        self.updated_at = now
     
     def add_manager_notes(self, notes: str):
         """Add manager-specific notes"""
+        now = datetime.utcnow()
         if self.manager_notes:
-            self.manager_notes += f"\n{datetime.utcnow().isoformat()}: {notes}"
+            self.manager_notes += f"\n{now.isoformat()}: {notes}"
         else:
-            self.manager_notes = f"{datetime.utcnow().isoformat()}: {notes}"
-        self.updated_at = datetime.utcnow()
+            self.manager_notes = f"{now.isoformat()}: {notes}"
+        self.updated_at = now
     
     def is_pending(self) -> bool:
         """Check if request is still pending"""
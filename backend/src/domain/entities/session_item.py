@@ -80,8 +80,9 @@ class SessionItem:
         else:
             self.status = SessionItemStatus.UNSOLD
         
-        self.end_time = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.end_time = now
+        self.updated_at = now
     
     def to_dict(self) -> dict:
         """Convert to dictionary representation"""
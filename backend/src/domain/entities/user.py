@@ -6,6 +6,12 @@ from typing import Optional, List
 from domain.enums import UserRole
 
 
+# Role sets for permission checks, built once at import
+_STAFF_ROLES = frozenset((UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN))
+_MANAGER_ROLES = frozenset((UserRole.MANAGER, UserRole.ADMIN))
+_MEMBER_ROLES = frozenset((UserRole.MEMBER, UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN))
+
+
 class User:
     """User domain entity"""
     
@@ -31,7 +37,7 @@ class User:
         self.phone = phone
         self.address = address
         self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.updated_at = updated_at or self.created_at
     
     def has_role(self, role: UserRole) -> bool:
         """Check if user has a specific role"""
@@ -43,11 +49,11 @@ class User:
     
     def is_staff_or_above(self) -> bool:
         """Check if user is staff, manager, or admin"""
-        return self.role in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]
+        return self.role in _STAFF_ROLES
     
     def is_manager_or_above(self) -> bool:
         """Check if user is manager or admin"""
-        return self.role in [UserRole.MANAGER, UserRole.ADMIN]
+        return self.role in _MANAGER_ROLES
     
     def is_admin(self) -> bool:
         """Check if user is admin"""
@@ -55,19 +61,19 @@ class User:
     
     def can_sell(self) -> bool:
         """Check if user can sell items"""
-        return self.role in [UserRole.MEMBER, UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]
+        return self.role in _MEMBER_ROLES
     
     def can_bid(self) -> bool:
         """Check if user can place bids"""
-        return self.role in [UserRole.MEMBER, UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]
+        return self.role in _MEMBER_ROLES
     
     def can_manage_auctions(self) -> bool:
         """Check if user can manage auction sessions"""
-        return self.role in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]
+        return self.role in _STAFF_ROLES
     
     def can_approve_items(self) -> bool:
         """Check if user can approve jewelry items"""
-        return self.role in [UserRole.MANAGER, UserRole.ADMIN]
+        return self.role in _MANAGER_ROLES
     
     def update_profile(self, name: str = None, phone: str = None, address: str = None):
         """Update user profile information"""
@@ -3,6 +3,8 @@ Base repository interface for the Jewelry Auction System
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, TypeVar, Generic
+from datetime import datetime
+from decimal import Decimal
 from sqlalchemy.orm import Session
 
 T = TypeVar('T')
@@ -93,6 +95,11 @@ class IJewelryItemRepository(BaseRepository[T]):
     def get_by_status(self, status: str) -> List[T]:
         """Get jewelry items by status"""
         pass
+    
+    @abstractmethod
+    def bulk_update_status(self, entity_ids: List[str], status: str) -> int:
+        """Set the status of many jewelry items at once"""
+        pass
 
 
 class ISellRequestRepository(BaseRepository[T]):
@@ -126,6 +133,27 @@ class IAuctionSessionRepository(BaseRepository[T]):
     def get_active_sessions(self) -> List[T]:
         """Get active auction sessions"""
         pass
+    
+    @abstractmethod
+    def transition_status(self, session_id: str, from_statuses, to_status: str, **fields) -> bool:
+        """Atomically move session from one of from_statuses to to_status"""
+        pass
+    
+    @abstractmethod
+    def close_if_expired(self, session_id: str, now: datetime) -> bool:
+        """Atomically close session if still open and past its end time"""
+        pass
+    
+    @abstractmethod
+    def open_due_scheduled(self, now: datetime) -> List[str]:
+        """Open all scheduled sessions whose start time has passed"""
+        pass
+    
+    @abstractmethod
+    def record_bid(self, session_id: str, amount: Decimal, bidder_id: str,
+                   extend_end_at: Optional[datetime] = None) -> None:
+        """Increment session bid counters, optionally extending end time"""
+        pass
 
 
 class IBidRepository(BaseRepository[T]):
@@ -145,6 +173,42 @@ class IBidRepository(BaseRepository[T]):
     def get_highest_bid(self, session_item_id: str) -> Optional[T]:
         """Get highest bid for session item"""
         pass
+    
+    @abstractmethod
+    def get_highest_bid_for_item(self, session_item_id: str) -> Optional[T]:
+        """Get highest active bid for session item"""
+        pass
+    
+    @abstractmethod
+    def get_session_statistics(self, session_id: str) -> Dict[str, Any]:
+        """Get aggregate bidding statistics for a session"""
+        pass
+    
+    @abstractmethod
+    def mark_previous_bids_as_outbid(self, session_item_id: str, current_bid_id: str) -> int:
+        """Mark all other standing bids on session item as outbid"""
+        pass
+    
+    @abstractmethod
+    def mark_winning_bid(self, session_item_id: str, winner_id: str) -> bool:
+        """Mark highest valid bid on session item as winning if it is winner's"""
+        pass
+    
+    @abstractmethod
+    def get_by_idempotency_key(self, bidder_id: str, session_item_id: str,
+                               idempotency_key: str) -> Optional[T]:
+        """Get bidder's earlier bid on session item by idempotency key"""
+        pass
+    
+    @abstractmethod
+    def get_bid_history_with_bidders(self, session_item_id: str, limit: int = 10) -> List[Any]:
+        """Get recent bids for session item joined with bidder details"""
+        pass
+    
+    @abstractmethod
+    def get_user_summary(self, user_id: str) -> Dict[str, Any]:
+        """Get aggregated bidding summary for user"""
+        pass
 
 
 class IPaymentRepository(BaseRepository[T]):
@@ -156,8 +220,23 @@ class IPaymentRepository(BaseRepository[T]):
         pass
 
     @abstractmethod
-    def get_by_status(self, status: str) -> List[T]:
-        """Get payments by status"""
+    def get_by_status(self, status: str, created_before: Optional[datetime] = None) -> List[T]:
+        """Get payments by status, optionally created before a cutoff"""
+        pass
+
+    @abstractmethod
+    def get_active_by_session_item_id(self, session_item_id: str, buyer_id: str) -> Optional[T]:
+        """Get buyer's non-canceled payment for session item"""
+        pass
+
+    @abstractmethod
+    def count_by_status_for_session(self, session_id: str) -> Dict[Any, int]:
+        """Count payments per status for session"""
+        pass
+
+    @abstractmethod
+    def get_by_session_item_ids(self, session_item_ids: List[str]) -> Dict[str, T]:
+        """Get existing payments for session items, keyed by session item ID"""
         pass
 
 
@@ -170,8 +249,18 @@ class IPayoutRepository(BaseRepository[T]):
         pass
 
     @abstractmethod
-    def get_by_status(self, status: str) -> List[T]:
-        """Get payouts by status"""
+    def get_by_status(self, status: str, created_before: Optional[datetime] = None) -> List[T]:
+        """Get payouts by status, optionally created before a cutoff"""
+        pass
+
+    @abstractmethod
+    def count_by_status_for_session(self, session_id: str) -> Dict[Any, int]:
+        """Count payouts per status for session"""
+        pass
+
+    @abstractmethod
+    def get_by_session_item_ids(self, session_item_ids: List[str]) -> Dict[str, T]:
+        """Get existing payouts for session items, keyed by session item ID"""
         pass
 
     @abstractmethod
@@ -180,6 +269,20 @@ class IPayoutRepository(BaseRepository[T]):
         pass
 
 
+class IRefundRepository(BaseRepository[T]):
+    """Refund repository interface"""
+
+    @abstractmethod
+    def get_by_payment_id(self, payment_id: str) -> List[T]:
+        """Get refunds for payment"""
+        pass
+
+    @abstractmethod
+    def exists_for_payment(self, payment_id: str) -> bool:
+        """Check whether payment has any refund"""
+        pass
+
+
 class ITransactionFeeRepository(BaseRepository[T]):
     """Transaction fee repository interface"""
 
@@ -202,11 +305,27 @@ class ISessionItemRepository(BaseRepository[T]):
         """Get session items by session"""
         pass
 
+    @abstractmethod
+    def get_by_id_with_session(self, item_id: str) -> Optional[T]:
+        """Get session item with its auction session eagerly loaded"""
+        pass
+    
+    @abstractmethod
+    def apply_bid(self, item_id: str, expected_version: int, amount: Decimal,
+                  winner_id: str, now: datetime) -> bool:
+        """Record new highest bid on session item if version still matches"""
+        pass
+
     @abstractmethod
     def get_by_jewelry_item(self, jewelry_item_id: str) -> Optional[T]:
         """Get session item by jewelry item"""
         pass
 
+    @abstractmethod
+    def has_active_assignment(self, jewelry_item_id: str) -> bool:
+        """Check whether jewelry item is held by an unfinished session"""
+        pass
+
     @abstractmethod
     def get_by_lot_number(self, session_id: str, lot_number: int) -> Optional[T]:
         """Get session item by lot number"""
@@ -221,6 +340,11 @@ class IEnrollmentRepository(BaseRepository[T]):
         """Get enrollment by user and session"""
         pass
 
+    @abstractmethod
+    def is_approved(self, session_id: str, user_id: str) -> bool:
+        """Check whether user is approved to bid in session"""
+        pass
+
     @abstractmethod
     def get_by_session(self, session_id: str) -> List[T]:
         """Get enrollments by session"""
@@ -23,14 +23,13 @@ def init_mssql(app):
 
     # Get database URI from app config
     database_uri = app.config['SQLALCHEMY_DATABASE_URI']
-    print(f"Initializing raw SQLAlchemy with URI: {database_uri}")
 
     # Initialize raw SQLAlchemy engine and session
     engine = create_engine(database_uri, echo=app.config.get('DEBUG', False))
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     session = scoped_session(SessionLocal)
 
-    print(f"Raw SQLAlchemy initialized - Engine: {engine}, Session: {session}")
+    app.logger.info("Raw SQLAlchemy initialized: %s", engine.url.render_as_string(hide_password=True))
 
     # Configure Flask-SQLAlchemy
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
@@ -44,7 +43,7 @@ def init_mssql(app):
         try:
             db.create_all()
         except Exception as e:
-            print(f"Warning: Could not create tables: {e}")
+            app.logger.warning("Could not create tables: %s", e)
 
 def get_db_session():
     """Get database session"""
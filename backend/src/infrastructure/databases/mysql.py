@@ -2,16 +2,20 @@
 MySQL database configuration and initialization
 """
 import os
+import logging
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.pool import QueuePool
 import pymysql
 
 # Install PyMySQL as MySQLdb
 pymysql.install_as_MySQLdb()
 
+logger = logging.getLogger(__name__)
+
 # Initialize extensions
 db = SQLAlchemy()
 migrate = Migrate()
@@ -54,7 +58,7 @@ def init_mysql(app: Flask) -> None:
         payment_model, notification_model
     )
 
-    print(f"✅ MySQL database initialized: {db_url}")
+    app.logger.info("MySQL database initialized: %s", make_url(db_url).render_as_string(hide_password=True))
 
 
 def create_database_if_not_exists():
@@ -75,10 +79,10 @@ def create_database_if_not_exists():
         # Create database if not exists
         with engine.connect() as conn:
             conn.execute(f"CREATE DATABASE IF NOT EXISTS {database_name} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
-            print(f"✅ Database '{database_name}' created or already exists")
+            logger.info("Database '%s' created or already exists", database_name)
 
     except Exception as e:
-        print(f"❌ Error creating database: {e}")
+        logger.error("Error creating database: %s", e)
 
 
 def get_db():
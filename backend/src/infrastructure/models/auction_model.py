@@ -1,7 +1,7 @@
 """
 Auction SQLAlchemy models for the Jewelry Auction System
 """
-from sqlalchemy import Column, String, Text, DateTime, Enum, DECIMAL, JSON, ForeignKey, Integer, Boolean
+from sqlalchemy import Column, String, Text, DateTime, Enum, DECIMAL, JSON, ForeignKey, Integer, Boolean, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from infrastructure.databases.mssql import db
 from domain.enums import SessionStatus, BidStatus, EnrollmentStatus
@@ -26,6 +26,11 @@ class AuctionSessionModel(db.Model):
     status = Column(Enum(SessionStatus), nullable=False, default=SessionStatus.DRAFT)
     assigned_staff_id = Column(String(36), ForeignKey('users.id'), nullable=True, index=True)
     rules = Column(JSON, nullable=True)  # Session-specific rules
+
+    # Bidding counters (maintained atomically on bid insert)
+    bid_count = Column(Integer, nullable=False, default=0)
+    highest_bid_amount = Column(DECIMAL(12, 2), nullable=True)
+    highest_bidder_id = Column(String(36), ForeignKey('users.id'), nullable=True)
     
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -85,6 +90,12 @@ class SessionItemModel(db.Model):
 class BidModel(db.Model):
     """Bid database model"""
     __tablename__ = 'bids'
+    __table_args__ = (
+        # Highest active bid lookup: seek by item/status, read amount in index order
+        Index('ix_bids_session_item_status_amount', 'session_item_id', 'status', 'amount'),
+        # Session bid listing: filter by status, keyset-paginate on placed_at
+        Index('ix_bids_session_status_placed_at', 'session_id', 'status', 'placed_at'),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     session_id = Column(String(36), ForeignKey('auction_sessions.id'), nullable=False, index=True)
@@ -116,6 +127,10 @@ class BidModel(db.Model):
 class EnrollmentModel(db.Model):
     """Enrollment database model (user enrollment in auction session)"""
     __tablename__ = 'enrollments'
+    __table_args__ = (
+        # One enrollment per user per session; also serves membership lookups
+        UniqueConstraint('session_id', 'user_id', name='uq_enrollments_session_user'),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     session_id = Column(String(36), ForeignKey('auction_sessions.id'), nullable=False, index=True)
@@ -1,7 +1,7 @@
 """
 Payment SQLAlchemy models for the Jewelry Auction System
 """
-from sqlalchemy import Column, String, Text, DateTime, Enum, DECIMAL, JSON, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, DateTime, Enum, DECIMAL, JSON, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from infrastructure.databases.mssql import db
 from domain.enums import PaymentStatus, PayoutStatus, PaymentMethod
@@ -12,6 +12,10 @@ import uuid
 class PaymentModel(db.Model):
     """Payment database model"""
     __tablename__ = 'payments'
+    __table_args__ = (
+        # Status scans (e.g. stale PENDING payments): seek by status, range on created_at
+        Index('ix_payments_status_created_at', 'status', 'created_at'),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     buyer_id = Column(String(36), ForeignKey('users.id'), nullable=False, index=True)
@@ -46,6 +50,10 @@ class PaymentModel(db.Model):
 class PayoutModel(db.Model):
     """Payout database model"""
     __tablename__ = 'payouts'
+    __table_args__ = (
+        # Status scans (e.g. stale PENDING payouts): seek by status, range on created_at
+        Index('ix_payouts_status_created_at', 'status', 'created_at'),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     seller_id = Column(String(36), ForeignKey('users.id'), nullable=False, index=True)
@@ -39,7 +39,8 @@ class UserModel(db.Model):
     jewelry_items = relationship("JewelryItemModel", back_populates="owner")
     sell_requests = relationship("SellRequestModel", back_populates="seller")
     appraisals = relationship("AppraisalModel", back_populates="staff")
-    managed_sessions = relationship("AuctionSessionModel", back_populates="assigned_staff")
+    managed_sessions = relationship("AuctionSessionModel", back_populates="assigned_staff",
+                                    foreign_keys="AuctionSessionModel.assigned_staff_id")
     enrollments = relationship("EnrollmentModel", back_populates="user", foreign_keys="EnrollmentModel.user_id")
     approved_enrollments = relationship("EnrollmentModel", foreign_keys="EnrollmentModel.approved_by")
     bids = relationship("BidModel", back_populates="bidder")
@@ -2,16 +2,26 @@
 Auction repository implementations for the Jewelry Auction System
 """
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, desc, asc, case, exists
 from infrastructure.models.auction_model import AuctionSessionModel, SessionItemModel, EnrollmentModel
 from infrastructure.models.jewelry_model import JewelryItemModel
 from infrastructure.models.user_model import UserModel
-from domain.enums import SessionStatus, JewelryStatus
+from domain.enums import SessionStatus, JewelryStatus, EnrollmentStatus
 from datetime import datetime
+from decimal import Decimal
 import uuid
 
 
+# Sessions in these states still hold their items
+_ACTIVE_SESSION_STATUSES = frozenset((
+    SessionStatus.DRAFT,
+    SessionStatus.SCHEDULED,
+    SessionStatus.OPEN,
+    SessionStatus.PAUSED
+))
+
+
 class AuctionSessionRepository:
     """Repository for auction session operations"""
     
@@ -77,6 +87,105 @@ class AuctionSessionRepository:
         self.session.commit()
         return session_model
     
+    def list_expired_open(self, now: datetime) -> List[AuctionSessionModel]:
+        """Get open sessions whose end time has passed"""
+        return self.session.query(AuctionSessionModel)\
+            .filter(AuctionSessionModel.status == SessionStatus.OPEN,
+                    AuctionSessionModel.end_at <= now)\
+            .all()
+    
+    def close_if_expired(self, session_id: str, now: datetime) -> bool:
+        """Close a session only if it is still OPEN and its end time has passed.
+        
+        Runs as a single conditional UPDATE in the caller's transaction; returns
+        False when the session was closed meanwhile or its end time was extended.
+        """
+        updated = self.session.query(AuctionSessionModel)\
+            .filter(AuctionSessionModel.id == session_id,
+                    AuctionSessionModel.status == SessionStatus.OPEN,
+                    AuctionSessionModel.end_at <= now)\
+            .update({
+                AuctionSessionModel.status: SessionStatus.CLOSED,
+                AuctionSessionModel.closed_at: now,
+                AuctionSessionModel.updated_at: now
+            }, synchronize_session=False)
+        
+        return updated == 1
+    
+    def open_due_scheduled(self, now: datetime) -> List[str]:
+        """Open every scheduled session whose start time has arrived (one bulk UPDATE).
+        
+        Runs in the caller's transaction; returns the IDs of the due sessions.
+        """
+        due_ids = [row.id for row in self.session.query(AuctionSessionModel.id)\
+            .filter(AuctionSessionModel.status == SessionStatus.SCHEDULED,
+                    AuctionSessionModel.start_at <= now)\
+            .all()]
+        if not due_ids:
+            return []
+        
+        self.session.query(AuctionSessionModel)\
+            .filter(AuctionSessionModel.id.in_(due_ids),
+                    AuctionSessionModel.status == SessionStatus.SCHEDULED)\
+            .update({
+                AuctionSessionModel.status: SessionStatus.OPEN,
+                AuctionSessionModel.opened_at: now,
+                AuctionSessionModel.updated_at: now
+            }, synchronize_session=False)
+        
+        return due_ids
+    
+    def transition_status(self, session_id: str, from_statuses, to_status: SessionStatus,
+                          **fields) -> bool:
+        """Move a session to to_status only if it is currently in from_statuses.
+
+        Runs as a single conditional UPDATE in the caller's transaction; returns
+        False when the session is missing or in another state.
+        """
+        values = {AuctionSessionModel.status: to_status,
+                  AuctionSessionModel.updated_at: datetime.utcnow()}
+        for key, value in fields.items():
+            values[getattr(AuctionSessionModel, key)] = value
+        
+        updated = self.session.query(AuctionSessionModel)\
+            .filter(AuctionSessionModel.id == session_id,
+                    AuctionSessionModel.status.in_(from_statuses))\
+            .update(values, synchronize_session='fetch')
+        
+        return updated == 1
+    
+    def record_bid(self, session_id: str, amount: Decimal, bidder_id: str,
+                   extend_end_at: Optional[datetime] = None) -> None:
+        """Atomically bump the session bid counters (runs in the caller's transaction).
+        
+        With ``extend_end_at`` the same UPDATE also pushes end_at out to at least
+        that time (anti-sniping), so concurrent late bids never shorten or
+        double-extend the session.
+        """
+        is_new_high = or_(AuctionSessionModel.highest_bid_amount.is_(None),
+                          AuctionSessionModel.highest_bid_amount < amount)
+        values = {
+            AuctionSessionModel.bid_count: AuctionSessionModel.bid_count + 1,
+            AuctionSessionModel.highest_bid_amount: case(
+                (is_new_high, amount),
+                else_=AuctionSessionModel.highest_bid_amount
+            ),
+            AuctionSessionModel.highest_bidder_id: case(
+                (is_new_high, bidder_id),
+                else_=AuctionSessionModel.highest_bidder_id
+            )
+        }
+        if extend_end_at is not None:
+            values[AuctionSessionModel.end_at] = case(
+                (AuctionSessionModel.end_at < extend_end_at, extend_end_at),
+                else_=AuctionSessionModel.end_at
+            )
+            values[AuctionSessionModel.updated_at] = datetime.utcnow()
+        
+        self.session.query(AuctionSessionModel)\
+            .filter(AuctionSessionModel.id == session_id)\
+            .update(values, synchronize_session=False)
+    
     def delete(self, session_id: str) -> bool:
         """Delete auction session"""
         session_model = self.get_by_id(session_id)
@@ -86,6 +195,14 @@ class AuctionSessionRepository:
         self.session.delete(session_model)
         self.session.commit()
         return True
+    
+    def commit(self):
+        """Commit the current transaction"""
+        self.session.commit()
+    
+    def rollback(self):
+        """Rollback the current transaction"""
+        self.session.rollback()
 
 
 class SessionItemRepository:
@@ -108,6 +225,32 @@ class SessionItemRepository:
         """Get session item by ID"""
         return self.session.query(SessionItemModel).filter_by(id=item_id).first()
     
+    def get_by_id_with_session(self, item_id: str) -> Optional[SessionItemModel]:
+        """Get session item with its auction session and jewelry item loaded in one query"""
+        return self.session.query(SessionItemModel)\
+            .options(joinedload(SessionItemModel.session),
+                     joinedload(SessionItemModel.jewelry_item))\
+            .filter_by(id=item_id)\
+            .first()
+    
+    def apply_bid(self, item_id: str, expected_version: int, amount: Decimal,
+                  winner_id: str, now: datetime) -> bool:
+        """Record a new highest bid if the item is still at expected_version.
+        
+        Returns False when another writer bumped the version first.
+        """
+        updated = self.session.query(SessionItemModel)\
+            .filter(SessionItemModel.id == item_id,
+                    SessionItemModel.version == expected_version)\
+            .update({
+                SessionItemModel.current_highest_bid: amount,
+                SessionItemModel.current_winner_id: winner_id,
+                SessionItemModel.bid_count: SessionItemModel.bid_count + 1,
+                SessionItemModel.version: SessionItemModel.version + 1,
+                SessionItemModel.updated_at: now
+            }, synchronize_session='fetch')
+        return updated == 1
+    
     def get_by_session_id(self, session_id: str) -> List[SessionItemModel]:
         """Get all items in a session"""
         return self.session.query(SessionItemModel)\
@@ -115,6 +258,26 @@ class SessionItemRepository:
             .order_by(asc(SessionItemModel.lot_number))\
             .all()
     
+    def get_by_session_ids(self, session_ids: List[str]) -> List[SessionItemModel]:
+        """Get all items across several sessions"""
+        if not session_ids:
+            return []
+        
+        return self.session.query(SessionItemModel)\
+            .filter(SessionItemModel.session_id.in_(session_ids))\
+            .order_by(asc(SessionItemModel.session_id), asc(SessionItemModel.lot_number))\
+            .all()
+    
+    def has_active_assignment(self, jewelry_item_id: str) -> bool:
+        """Check whether a jewelry item is already assigned to a session that has not finished"""
+        return self.session.query(
+            exists().where(and_(
+                SessionItemModel.jewelry_item_id == jewelry_item_id,
+                SessionItemModel.session_id == AuctionSessionModel.id,
+                AuctionSessionModel.status.in_(_ACTIVE_SESSION_STATUSES)
+            ))
+        ).scalar()
+    
     def get_by_session_and_jewelry(self, session_id: str, jewelry_id: str) -> Optional[SessionItemModel]:
         """Get session item by session and jewelry ID"""
         return self.session.query(SessionItemModel)\
@@ -181,6 +344,20 @@ class EnrollmentRepository:
             .filter_by(user_id=user_id, session_id=session_id)\
             .first()
     
+    def get_by_session_and_user(self, session_id: str, user_id: str) -> Optional[EnrollmentModel]:
+        """Get enrollment by session and user"""
+        return self.get_by_user_and_session(user_id, session_id)
+    
+    def is_approved(self, session_id: str, user_id: str) -> bool:
+        """Check whether user has an approved enrollment in session (single EXISTS probe)"""
+        return self.session.query(
+            exists().where(and_(
+                EnrollmentModel.session_id == session_id,
+                EnrollmentModel.user_id == user_id,
+                EnrollmentModel.status == EnrollmentStatus.APPROVED
+            ))
+        ).scalar()
+    
     def get_by_session_id(self, session_id: str) -> List[EnrollmentModel]:
         """Get all enrollments for a session"""
         return self.session.query(EnrollmentModel)\
@@ -220,5 +397,13 @@ class EnrollmentRepository:
     
     def is_user_enrolled(self, user_id: str, session_id: str) -> bool:
         """Check if user is enrolled in session"""
-        enrollment = self.get_by_user_and_session(user_id, session_id)
-        return enrollment is not None
+        return self.session.query(
+            exists().where(and_(
+                EnrollmentModel.session_id == session_id,
+                EnrollmentModel.user_id == user_id
+            ))
+        ).scalar()
+    
+    def rollback(self):
+        """Rollback the current transaction"""
+        self.session.rollback()
@@ -1,12 +1,12 @@
 """
 Bid repository implementation for the Jewelry Auction System
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy import and_, or_, desc, asc, func, case
 from infrastructure.models.auction_model import BidModel, SessionItemModel, AuctionSessionModel
 from infrastructure.models.user_model import UserModel
-from domain.enums import SessionStatus
+from domain.enums import SessionStatus, BidStatus
 from datetime import datetime
 from decimal import Decimal
 import uuid
@@ -19,34 +19,61 @@ class BidRepository:
         self.session = session
     
     def create(self, bid_data: Dict[str, Any]) -> BidModel:
-        """Create a new bid"""
+        """Create a new bid (flushed; committed by the caller's transaction)"""
         bid_model = BidModel(
             id=str(uuid.uuid4()),
-            placed_at=datetime.utcnow(),
-            **bid_data
+            **{'placed_at': datetime.utcnow(), **bid_data}
         )
         self.session.add(bid_model)
-        self.session.commit()
+        self.session.flush()
         return bid_model
     
     def get_by_id(self, bid_id: str) -> Optional[BidModel]:
         """Get bid by ID"""
         return self.session.query(BidModel).filter_by(id=bid_id).first()
     
+    def get_by_idempotency_key(self, bidder_id: str, session_item_id: str,
+                               idempotency_key: str) -> Optional[BidModel]:
+        """Get a bidder's earlier bid on a session item by idempotency key"""
+        return self.session.query(BidModel)\
+            .filter_by(bidder_id=bidder_id,
+                       session_item_id=session_item_id,
+                       idempotency_key=idempotency_key)\
+            .first()
+    
     def get_by_session_id(self, session_id: str, 
                          page: int = 1, 
-                         limit: int = 50) -> Dict[str, Any]:
-        """Get all bids for a session with pagination"""
+                         limit: int = 50,
+                         status: Optional[BidStatus] = None,
+                         before: Optional[Tuple[datetime, str]] = None) -> Dict[str, Any]:
+        """Get bids for a session, optionally filtered by status.
+        
+        When ``before`` is given as a ``(placed_at, id)`` cursor, keyset pagination
+        is used (bids strictly after that bid in ``placed_at DESC, id DESC`` order)
+        and ``page`` is ignored.
+        """
         query = self.session.query(BidModel)\
-            .filter_by(session_id=session_id)\
-            .order_by(desc(BidModel.placed_at))
+            .filter(BidModel.session_id == session_id)
+        
+        if status is not None:
+            query = query.filter(BidModel.status == status)
         
         # Get total count
         total = query.count()
         
+        # id breaks placed_at ties so the keyset cursor never skips a bid
+        query = query.order_by(desc(BidModel.placed_at), desc(BidModel.id))
+        
         # Apply pagination
-        offset = (page - 1) * limit
-        bids = query.offset(offset).limit(limit).all()
+        if before is not None:
+            before_placed_at, before_id = before
+            bids = query.filter(or_(
+                BidModel.placed_at < before_placed_at,
+                and_(BidModel.placed_at == before_placed_at, BidModel.id < before_id)
+            )).limit(limit).all()
+        else:
+            offset = (page - 1) * limit
+            bids = query.offset(offset).limit(limit).all()
         
         return {
             'items': bids,
@@ -106,6 +133,15 @@ class BidRepository:
             .order_by(desc(BidModel.amount))\
             .first()
     
+    def get_highest_bid_for_item(self, session_item_id: str) -> Optional[BidModel]:
+        """Get the highest active (non-invalid) bid for a session item"""
+        return self.session.query(BidModel)\
+            .filter(BidModel.session_item_id == session_item_id,
+                    BidModel.status != BidStatus.INVALID)\
+            .order_by(desc(BidModel.amount))\
+            .limit(1)\
+            .first()
+    
     def get_current_highest_amount(self, session_item_id: str) -> Decimal:
         """Get current highest bid amount for a session item"""
         result = self.session.query(func.max(BidModel.amount))\
@@ -123,6 +159,16 @@ class BidRepository:
             .limit(limit)\
             .all()
     
+    def get_bid_history_with_bidders(self, session_item_id: str,
+                                     limit: int = 10) -> List[Tuple[BidModel, str, bool]]:
+        """Get recent bid history with bidder name/verification joined in one query"""
+        return self.session.query(BidModel, UserModel.name, UserModel.email_verified)\
+            .join(UserModel, UserModel.id == BidModel.bidder_id)\
+            .filter(BidModel.session_item_id == session_item_id)\
+            .order_by(desc(BidModel.placed_at))\
+            .limit(limit)\
+            .all()
+    
     def get_winning_bids_by_session(self, session_id: str) -> List[Dict[str, Any]]:
         """Get winning bids for each item in a session"""
         # Subquery to get highest bid amount per session item
@@ -185,6 +231,47 @@ class BidRepository:
         self.session.commit()
         return bid_model
     
+    def mark_previous_bids_as_outbid(self, session_item_id: str, current_bid_id: str) -> int:
+        """Mark all other standing bids on a session item as outbid in a single UPDATE"""
+        return self.session.query(BidModel)\
+            .filter(BidModel.session_item_id == session_item_id,
+                    BidModel.id != current_bid_id,
+                    BidModel.status.in_((BidStatus.VALID, BidStatus.WINNING)))\
+            .update({
+                BidModel.status: BidStatus.OUTBID,
+                BidModel.updated_at: datetime.utcnow()
+            }, synchronize_session=False)
+    
+    def mark_winning_bid(self, session_item_id: str, winner_id: str) -> bool:
+        """Mark the highest valid bid on a session item as WINNING in a single UPDATE.
+        
+        Only applies when that bid belongs to winner_id; returns whether a bid was marked.
+        """
+        highest_bid_id = self.session.query(BidModel.id)\
+            .filter(BidModel.session_item_id == session_item_id,
+                    BidModel.status != BidStatus.INVALID)\
+            .order_by(desc(BidModel.amount))\
+            .limit(1)\
+            .scalar_subquery()
+        
+        updated = self.session.query(BidModel)\
+            .filter(BidModel.id == highest_bid_id,
+                    BidModel.bidder_id == winner_id)\
+            .update({
+                BidModel.status: BidStatus.WINNING,
+                BidModel.updated_at: datetime.utcnow()
+            }, synchronize_session=False)
+        
+        return updated == 1
+    
+    def commit(self):
+        """Commit the current transaction"""
+        self.session.commit()
+    
+    def rollback(self):
+        """Rollback the current transaction"""
+        self.session.rollback()
+    
     def delete(self, bid_id: str) -> bool:
         """Delete bid (admin only, rare use case)"""
         bid_model = self.get_by_id(bid_id)
@@ -196,29 +283,59 @@ class BidRepository:
         return True
     
     def get_session_statistics(self, session_id: str) -> Dict[str, Any]:
-        """Get bidding statistics for a session"""
-        total_bids = self.session.query(BidModel)\
-            .filter_by(session_id=session_id)\
-            .count()
+        """Get bidding statistics for a session in a single aggregate query"""
+        total_bids, unique_bidders, total_value, avg_bid, highest_bid, lowest_bid = \
+            self.session.query(
+                func.count(BidModel.id),
+                func.count(func.distinct(BidModel.bidder_id)),
+                func.sum(BidModel.amount),
+                func.avg(BidModel.amount),
+                func.max(BidModel.amount),
+                func.min(BidModel.amount)
+            ).filter(BidModel.session_id == session_id)\
+             .one()
         
-        unique_bidders = self.session.query(BidModel.bidder_id)\
-            .filter_by(session_id=session_id)\
-            .distinct()\
-            .count()
+        return {
+            'total_bids': total_bids,
+            'unique_bidders': unique_bidders,
+            'total_bid_value': total_value or Decimal('0.00'),
+            'average_bid_amount': avg_bid or Decimal('0.00'),
+            'highest_bid_amount': highest_bid or Decimal('0.00'),
+            'lowest_bid_amount': lowest_bid or Decimal('0.00')
+        }
+
+    def get_user_summary(self, user_id: str) -> Dict[str, Any]:
+        """Get a user's bidding summary in a single aggregate query"""
+        valid_amount = case((BidModel.status != BidStatus.INVALID, BidModel.amount))
         
-        total_value = self.session.query(func.sum(BidModel.amount))\
-            .filter_by(session_id=session_id)\
-            .scalar() or Decimal('0.00')
+        def count_status(status: BidStatus):
+            return func.sum(case((BidModel.status == status, 1), else_=0))
         
-        avg_bid = self.session.query(func.avg(BidModel.amount))\
-            .filter_by(session_id=session_id)\
-            .scalar() or Decimal('0.00')
+        row = self.session.query(
+            func.count(BidModel.id).label('total_bids'),
+            count_status(BidStatus.WINNING).label('winning_bids'),
+            count_status(BidStatus.OUTBID).label('outbid_bids'),
+            count_status(BidStatus.INVALID).label('invalid_bids'),
+            func.count(func.distinct(BidModel.session_id)).label('sessions_participated'),
+            func.count(func.distinct(BidModel.session_item_id)).label('items_bid_on'),
+            func.avg(valid_amount).label('average_bid_amount'),
+            func.max(valid_amount).label('highest_bid_amount'),
+            func.min(valid_amount).label('lowest_bid_amount'),
+            func.sum(case((BidModel.status == BidStatus.WINNING, BidModel.amount))).label('total_winning_value')
+        ).filter(BidModel.bidder_id == user_id)\
+         .one()
         
         return {
-            'total_bids': total_bids,
-            'unique_bidders': unique_bidders,
-            'total_bid_value': total_value,
-            'average_bid_amount': avg_bid
+            'total_bids': row.total_bids,
+            'winning_bids': row.winning_bids or 0,
+            'outbid_bids': row.outbid_bids or 0,
+            'invalid_bids': row.invalid_bids or 0,
+            'sessions_participated': row.sessions_participated,
+            'items_bid_on': row.items_bid_on,
+            'average_bid_amount': row.average_bid_amount or Decimal('0.00'),
+            'highest_bid_amount': row.highest_bid_amount or Decimal('0.00'),
+            'lowest_bid_amount': row.lowest_bid_amount or Decimal('0.00'),
+            'total_winning_value': row.total_winning_value or Decimal('0.00')
         }
 
     def count_by_session_id(self, session_id: str) -> int:
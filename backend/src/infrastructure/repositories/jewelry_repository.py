@@ -9,6 +9,7 @@ from domain.entities.jewelry_item import JewelryItem
 from domain.enums import JewelryStatus
 from infrastructure.models.jewelry_model import JewelryItemModel
 from domain.exceptions import NotFoundError, ConflictError
+from datetime import datetime
 
 
 class JewelryItemRepository(IJewelryItemRepository[JewelryItem]):
@@ -88,6 +89,21 @@ class JewelryItemRepository(IJewelryItemRepository[JewelryItem]):
         self.session.flush()
         return self._to_domain_entity(jewelry_model)
     
+    def bulk_update_status(self, entity_ids: List[str], status: JewelryStatus) -> int:
+        """Set the status of many jewelry items in a single UPDATE"""
+        if not entity_ids:
+            return 0
+        
+        updated = self.session.query(JewelryItemModel)\
+            .filter(JewelryItemModel.id.in_(entity_ids))\
+            .update({
+                JewelryItemModel.status: status,
+                JewelryItemModel.updated_at: datetime.utcnow()
+            }, synchronize_session=False)
+        
+        self.session.flush()
+        return updated
+    
     def delete(self, entity_id: str) -> bool:
         """Delete a jewelry item"""
         jewelry_model = self.session.query(JewelryItemModel).filter_by(id=entity_id).first()
@@ -3,8 +3,9 @@ Payment repository implementations for the Jewelry Auction System
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy import and_, or_, desc, asc, func, exists
 from infrastructure.models.payment_model import PaymentModel, PayoutModel, TransactionFeeModel, RefundModel
+from infrastructure.models.auction_model import SessionItemModel
 from domain.enums import PaymentStatus, PaymentMethod, PayoutStatus
 from datetime import datetime
 from decimal import Decimal
@@ -18,13 +19,13 @@ class PaymentRepository:
         self.session = session
     
     def create(self, payment_data: Dict[str, Any]) -> PaymentModel:
-        """Create a new payment"""
+        """Create a new payment (flushed; committed by the caller's transaction)"""
         payment_model = PaymentModel(
             id=str(uuid.uuid4()),
             **payment_data
         )
         self.session.add(payment_model)
-        self.session.commit()
+        self.session.flush()
         return payment_model
     
     def get_by_id(self, payment_id: str) -> Optional[PaymentModel]:
@@ -57,6 +58,46 @@ class PaymentRepository:
             .order_by(desc(PaymentModel.created_at))\
             .all()
     
+    def get_active_by_session_item_id(self, session_item_id: str, buyer_id: str) -> Optional[PaymentModel]:
+        """Get the buyer's non-canceled payment for a session item (filtered and limited in SQL)"""
+        return self.session.query(PaymentModel)\
+            .filter(PaymentModel.session_item_id == session_item_id,
+                    PaymentModel.buyer_id == buyer_id,
+                    PaymentModel.status != PaymentStatus.CANCELED)\
+            .first()
+    
+    def get_by_status(self, status: PaymentStatus,
+                      created_before: Optional[datetime] = None) -> List[PaymentModel]:
+        """Get payments in a status, optionally only those created before a cutoff"""
+        query = self.session.query(PaymentModel)\
+            .filter(PaymentModel.status == status)
+        
+        if created_before is not None:
+            query = query.filter(PaymentModel.created_at < created_before)
+        
+        return query.order_by(asc(PaymentModel.created_at)).all()
+    
+    def get_by_session_item_ids(self, session_item_ids: List[str]) -> Dict[str, PaymentModel]:
+        """Get existing payments for many session items in one query, keyed by session item ID"""
+        if not session_item_ids:
+            return {}
+        
+        payments = self.session.query(PaymentModel)\
+            .filter(PaymentModel.session_item_id.in_(session_item_ids))\
+            .all()
+        
+        return {record.session_item_id: record for record in payments}
+    
+    def count_by_status_for_session(self, session_id: str) -> Dict[PaymentStatus, int]:
+        """Count payments per status for a session's items in one GROUP BY query"""
+        rows = self.session.query(PaymentModel.status, func.count(PaymentModel.id))\
+            .join(SessionItemModel, SessionItemModel.id == PaymentModel.session_item_id)\
+            .filter(SessionItemModel.session_id == session_id)\
+            .group_by(PaymentModel.status)\
+            .all()
+        
+        return dict(rows)
+    
     def update(self, payment_id: str, update_data: Dict[str, Any]) -> Optional[PaymentModel]:
         """Update payment"""
         payment_model = self.get_by_id(payment_id)
@@ -70,6 +111,14 @@ class PaymentRepository:
         payment_model.updated_at = datetime.utcnow()
         self.session.commit()
         return payment_model
+    
+    def commit(self):
+        """Commit the current transaction"""
+        self.session.commit()
+    
+    def rollback(self):
+        """Rollback the current transaction"""
+        self.session.rollback()
 
 
 class PayoutRepository:
@@ -79,13 +128,13 @@ class PayoutRepository:
         self.session = session
     
     def create(self, payout_data: Dict[str, Any]) -> PayoutModel:
-        """Create a new payout"""
+        """Create a new payout (flushed; committed by the caller's transaction)"""
         payout_model = PayoutModel(
             id=str(uuid.uuid4()),
             **payout_data
         )
         self.session.add(payout_model)
-        self.session.commit()
+        self.session.flush()
         return payout_model
     
     def get_by_id(self, payout_id: str) -> Optional[PayoutModel]:
@@ -111,6 +160,38 @@ class PayoutRepository:
             'limit': limit
         }
     
+    def get_by_status(self, status: PayoutStatus,
+                      created_before: Optional[datetime] = None) -> List[PayoutModel]:
+        """Get payouts in a status, optionally only those created before a cutoff"""
+        query = self.session.query(PayoutModel)\
+            .filter(PayoutModel.status == status)
+        
+        if created_before is not None:
+            query = query.filter(PayoutModel.created_at < created_before)
+        
+        return query.order_by(asc(PayoutModel.created_at)).all()
+    
+    def get_by_session_item_ids(self, session_item_ids: List[str]) -> Dict[str, PayoutModel]:
+        """Get existing payouts for many session items in one query, keyed by session item ID"""
+        if not session_item_ids:
+            return {}
+        
+        payouts = self.session.query(PayoutModel)\
+            .filter(PayoutModel.session_item_id.in_(session_item_ids))\
+            .all()
+        
+        return {record.session_item_id: record for record in payouts}
+    
+    def count_by_status_for_session(self, session_id: str) -> Dict[PayoutStatus, int]:
+        """Count payouts per status for a session's items in one GROUP BY query"""
+        rows = self.session.query(PayoutModel.status, func.count(PayoutModel.id))\
+            .join(SessionItemModel, SessionItemModel.id == PayoutModel.session_item_id)\
+            .filter(SessionItemModel.session_id == session_id)\
+            .group_by(PayoutModel.status)\
+            .all()
+        
+        return dict(rows)
+    
     def update(self, payout_id: str, update_data: Dict[str, Any]) -> Optional[PayoutModel]:
         """Update payout"""
         payout_model = self.get_by_id(payout_id)
@@ -124,6 +205,14 @@ class PayoutRepository:
         payout_model.updated_at = datetime.utcnow()
         self.session.commit()
         return payout_model
+    
+    def commit(self):
+        """Commit the current transaction"""
+        self.session.commit()
+    
+    def rollback(self):
+        """Rollback the current transaction"""
+        self.session.rollback()
 
 
 class TransactionFeeRepository:
@@ -181,6 +270,12 @@ class RefundRepository:
             .order_by(desc(RefundModel.created_at))\
             .all()
     
+    def exists_for_payment(self, payment_id: str) -> bool:
+        """Check whether a payment has any refund (single EXISTS probe)"""
+        return self.session.query(
+            exists().where(RefundModel.payment_id == payment_id)
+        ).scalar()
+    
     def update(self, refund_id: str, update_data: Dict[str, Any]) -> Optional[RefundModel]:
         """Update refund"""
         refund_model = self.get_by_id(refund_id)
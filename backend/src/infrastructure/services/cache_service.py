@@ -0,0 +1,86 @@
+"""
+Cache service for the Jewelry Auction System
+"""
+import json
+from typing import Any, Optional, Tuple
+from flask import current_app
+import redis
+from redis.exceptions import RedisError
+
+
+_clients = {}
+
+
+def session_stats_key(session_id: str) -> str:
+    """Cache key for an auction session's bidding statistics"""
+    return f"auction:stats:{session_id}"
+
+
+def session_detail_key(session_id: str) -> str:
+    """Cache key for an auction session's serialized detail"""
+    return f"auction:session:{session_id}"
+
+
+def session_items_key(session_id: str) -> str:
+    """Cache key for an auction session's serialized item list"""
+    return f"auction:session_items:{session_id}"
+
+
+def session_cache_keys(session_id: str) -> Tuple[str, ...]:
+    """All cache keys derived from an auction session's rows"""
+    return (session_stats_key(session_id), session_detail_key(session_id), session_items_key(session_id))
+
+
+def jewelry_active_session_key(jewelry_item_id: str) -> str:
+    """Cache key for the unfinished session currently holding a jewelry item"""
+    return f"jewelry:active_session:{jewelry_item_id}"
+
+
+def get_redis_client() -> redis.Redis:
+    """Get a Redis client for the configured REDIS_URL (one connection pool per URL)"""
+    url = current_app.config.get('REDIS_URL', 'redis://localhost:6379/0')
+    client = _clients.get(url)
+    if client is None:
+        client = redis.Redis.from_url(
+            url,
+            socket_timeout=current_app.config.get('REDIS_SOCKET_TIMEOUT', 0.1),
+            socket_connect_timeout=current_app.config.get('REDIS_SOCKET_TIMEOUT', 0.1)
+        )
+        _clients[url] = client
+    return client
+
+
+class CacheService:
+    """JSON cache backed by Redis.
+
+    Redis is an optimization only: any Redis failure is treated as a cache miss
+    so callers fall back to the database.
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self.client = client if client is not None else get_redis_client()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on miss"""
+        try:
+            raw = self.client.get(key)
+        except RedisError:
+            return None
+
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Cache a JSON-serializable value for ttl_seconds"""
+        try:
+            self.client.setex(key, ttl_seconds, json.dumps(value, default=str))
+        except RedisError:
+            pass
+
+    def delete(self, *keys: str) -> None:
+        """Invalidate cached keys"""
+        if not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except RedisError:
+            pass
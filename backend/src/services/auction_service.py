@@ -21,12 +21,37 @@ from domain.repositories.base_repository import (
     IEnrollmentRepository,
     IJewelryItemRepository
 )
-from domain.constants import SESSION_CODE_PREFIX, SESSION_CODE_LENGTH
+from domain.constants import SESSION_CODE_PREFIX, SESSION_CODE_LENGTH, CACHE_TTL_LONG_SECONDS, SESSION_CACHE_TTL_SECONDS
+from infrastructure.services.cache_service import (
+    CacheService,
+    session_cache_keys,
+    session_detail_key,
+    session_items_key,
+    jewelry_active_session_key
+)
+from sqlalchemy.exc import IntegrityError
 import uuid
 import random
 import string
 
 
+# Role and status groups used in permission/state checks
+_STAFF_ROLES = frozenset((UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN))
+_MANAGER_ROLES = frozenset((UserRole.MANAGER, UserRole.ADMIN))
+_EDITABLE_STATUSES = frozenset((SessionStatus.DRAFT, SessionStatus.SCHEDULED))
+_ENROLLABLE_STATUSES = frozenset((SessionStatus.SCHEDULED, SessionStatus.OPEN))
+_CLOSABLE_STATUSES = frozenset((SessionStatus.OPEN, SessionStatus.PAUSED))
+
+# Error messages and machine-readable codes shared across error paths
+ERR_SESSION_NOT_FOUND = "Auction session not found"
+ERR_SESSION_ITEM_NOT_FOUND = "Session item not found"
+ERR_JEWELRY_NOT_FOUND = "Jewelry item not found"
+CODE_SESSION_NOT_FOUND = "SESSION_NOT_FOUND"
+CODE_SESSION_ITEM_NOT_FOUND = "SESSION_ITEM_NOT_FOUND"
+CODE_JEWELRY_NOT_FOUND = "JEWELRY_NOT_FOUND"
+CODE_NOT_AUTHORIZED = "NOT_AUTHORIZED"
+CODE_INVALID_SESSION_STATUS = "INVALID_SESSION_STATUS"
+
 class AuctionService:
     """Auction management service"""
     
@@ -34,17 +59,19 @@ class AuctionService:
                  session_repository: IAuctionSessionRepository,
                  session_item_repository: ISessionItemRepository,
                  enrollment_repository: IEnrollmentRepository,
-                 jewelry_repository: IJewelryItemRepository):
+                 jewelry_repository: IJewelryItemRepository,
+                 cache_service: Optional[CacheService] = None):
         self.session_repository = session_repository
         self.session_item_repository = session_item_repository
         self.enrollment_repository = enrollment_repository
         self.jewelry_repository = jewelry_repository
+        self.cache_service = cache_service
     
     def create_auction_session(self, user_role: UserRole, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new auction session"""
         # Only staff and above can create sessions
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to create auction sessions")
+        if user_role not in _STAFF_ROLES:
+            raise AuthorizationError("Not authorized to create auction sessions", CODE_NOT_AUTHORIZED)
         
         # Validate session data
         is_valid, error_message = AuctionRules.can_create_session(
@@ -86,12 +113,22 @@ class AuctionService:
         return self._session_to_dict(created_session)
     
     def get_auction_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get auction session by ID"""
+        """Get auction session by ID (briefly cached; evicted on session writes)"""
+        cache_key = session_detail_key(session_id)
+        if self.cache_service:
+            cached = self.cache_service.get(cache_key)
+            if cached is not None:
+                return cached
+        
         session = self.session_repository.get_by_id(session_id)
         if not session:
             return None
         
-        return self._session_to_dict(session)
+        result = self._session_to_dict(session)
+        if self.cache_service:
+            self.cache_service.set(cache_key, result, SESSION_CACHE_TTL_SECONDS)
+        
+        return result
     
     def get_session_by_code(self, code: str) -> Optional[Dict[str, Any]]:
         """Get auction session by code"""
@@ -119,15 +156,15 @@ class AuctionService:
     def update_auction_session(self, session_id: str, user_role: UserRole, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update auction session"""
         # Only staff and above can update sessions
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to update auction sessions")
+        if user_role not in _STAFF_ROLES:
+            raise AuthorizationError("Not authorized to update auction sessions", CODE_NOT_AUTHORIZED)
         
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
         
         # Check if session can be updated
-        if session.status not in [SessionStatus.DRAFT, SessionStatus.SCHEDULED]:
+        if session.status not in _EDITABLE_STATUSES:
             raise BusinessRuleViolationError("Cannot update session in current status")
         
         # Update allowed fields
@@ -154,25 +191,26 @@ class AuctionService:
         # Save changes
         updated_session = self.session_repository.update(session)
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
         
         return self._session_to_dict(updated_session)
     
     def add_item_to_session(self, session_id: str, jewelry_item_id: str, user_role: UserRole, item_data: Dict[str, Any]) -> Dict[str, Any]:
         """Add jewelry item to auction session"""
         # Only staff and above can add items to sessions
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to add items to sessions")
+        if user_role not in _STAFF_ROLES:
+            raise AuthorizationError("Not authorized to add items to sessions", CODE_NOT_AUTHORIZED)
         
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
         
         jewelry_item = self.jewelry_repository.get_by_id(jewelry_item_id)
         if not jewelry_item:
-            raise NotFoundError("Jewelry item not found")
+            raise NotFoundError(ERR_JEWELRY_NOT_FOUND, CODE_JEWELRY_NOT_FOUND)
         
         # Check if session can have items added
-        if session.status not in [SessionStatus.DRAFT, SessionStatus.SCHEDULED]:
+        if session.status not in _EDITABLE_STATUSES:
             raise BusinessRuleViolationError("Cannot add items to session in current status")
         
         # Check if jewelry item is approved
@@ -201,25 +239,26 @@ class AuctionService:
         self.jewelry_repository.update(jewelry_item)
         
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
         
         return self._session_item_to_dict(created_item)
     
     def remove_item_from_session(self, session_id: str, session_item_id: str, user_role: UserRole) -> bool:
         """Remove jewelry item from auction session"""
         # Only staff and above can remove items from sessions
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to remove items from sessions")
+        if user_role not in _STAFF_ROLES:
+            raise AuthorizationError("Not authorized to remove items from sessions", CODE_NOT_AUTHORIZED)
         
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
         
         session_item = self.session_item_repository.get_by_id(session_item_id)
         if not session_item or session_item.session_id != session_id:
-            raise NotFoundError("Session item not found")
+            raise NotFoundError(ERR_SESSION_ITEM_NOT_FOUND, CODE_SESSION_ITEM_NOT_FOUND)
         
         # Check if session allows item removal
-        if session.status not in [SessionStatus.DRAFT, SessionStatus.SCHEDULED]:
+        if session.status not in _EDITABLE_STATUSES:
             raise BusinessRuleViolationError("Cannot remove items from session in current status")
         
         # Update jewelry item status back to approved
@@ -232,49 +271,67 @@ class AuctionService:
         # Remove session item
         self.session_item_repository.delete(session_item_id)
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
+        if self.cache_service:
+            self.cache_service.delete(jewelry_active_session_key(session_item.jewelry_item_id))
         
         return True
     
     def get_session_items(self, session_id: str) -> List[Dict[str, Any]]:
-        """Get all items in an auction session"""
+        """Get all items in an auction session (briefly cached; evicted on session writes)"""
+        cache_key = session_items_key(session_id)
+        if self.cache_service:
+            cached = self.cache_service.get(cache_key)
+            if cached is not None:
+                return cached
+        
         session_items = self.session_item_repository.get_by_session_id(session_id)
-        return [self._session_item_to_dict(item) for item in session_items]
+        result = [self._session_item_to_dict(item) for item in session_items]
+        if self.cache_service:
+            self.cache_service.set(cache_key, result, SESSION_CACHE_TTL_SECONDS)
+        
+        return result
     
     def enroll_user_in_session(self, session_id: str, user_id: str) -> Dict[str, Any]:
         """Enroll user in auction session"""
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
         
         # Check if session allows enrollment
-        if session.status not in [SessionStatus.SCHEDULED, SessionStatus.OPEN]:
+        if session.status not in _ENROLLABLE_STATUSES:
             raise BusinessRuleViolationError("Session is not open for enrollment")
         
         # Check if user is already enrolled
         existing_enrollment = self.enrollment_repository.get_by_session_and_user(session_id, user_id)
         if existing_enrollment:
             return self._enrollment_to_dict(existing_enrollment)
-        
-        # Create enrollment
-        enrollment = Enrollment(
-            session_id=session_id,
-            user_id=user_id,
-            status=EnrollmentStatus.PENDING
-        )
-        
-        created_enrollment = self.enrollment_repository.create(enrollment)
-        self.enrollment_repository.commit()
-        
+
+        # A concurrent join can still slip past the check; where the unique
+        # (session_id, user_id) constraint exists, fall back to the winning row
+        try:
+            created_enrollment = self.enrollment_repository.create({
+                'session_id': session_id,
+                'user_id': user_id,
+                'status': EnrollmentStatus.PENDING
+            })
+        except IntegrityError:
+            self.enrollment_repository.rollback()
+            existing_enrollment = self.enrollment_repository.get_by_session_and_user(session_id, user_id)
+            if not existing_enrollment:
+                raise
+            return self._enrollment_to_dict(existing_enrollment)
+
         return self._enrollment_to_dict(created_enrollment)
 
     def schedule_session(self, session_id: str, user_role: UserRole) -> Dict[str, Any]:
         """Schedule an auction session"""
-        if user_role not in [UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to schedule sessions")
+        if user_role not in _MANAGER_ROLES:
+            raise AuthorizationError("Not authorized to schedule sessions", CODE_NOT_AUTHORIZED)
 
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
 
         if session.status != SessionStatus.DRAFT:
             raise BusinessRuleViolationError("Can only schedule draft sessions")
@@ -293,17 +350,18 @@ class AuctionService:
 
         updated_session = self.session_repository.update(session)
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
 
         return self._session_to_dict(updated_session)
 
     def open_session(self, session_id: str, user_role: UserRole) -> Dict[str, Any]:
         """Open an auction session for bidding"""
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to open sessions")
+        if user_role not in _STAFF_ROLES:
+            raise AuthorizationError("Not authorized to open sessions", CODE_NOT_AUTHORIZED)
 
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
 
         if session.status != SessionStatus.SCHEDULED:
             raise BusinessRuleViolationError("Can only open scheduled sessions")
@@ -315,19 +373,20 @@ class AuctionService:
 
         updated_session = self.session_repository.update(session)
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
 
         return self._session_to_dict(updated_session)
 
     def close_session(self, session_id: str, user_role: UserRole) -> Dict[str, Any]:
         """Close an auction session"""
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
-            raise AuthorizationError("Not authorized to close sessions")
+        if user_role not in _STAFF_ROLES:
+            raise AuthorizationError("Not authorized to close sessions", CODE_NOT_AUTHORIZED)
 
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
 
-        if session.status not in [SessionStatus.OPEN, SessionStatus.PAUSED]:
+        if session.status not in _CLOSABLE_STATUSES:
             raise BusinessRuleViolationError("Can only close open or paused sessions")
 
         # Update status
@@ -337,9 +396,27 @@ class AuctionService:
 
         updated_session = self.session_repository.update(session)
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
 
         return self._session_to_dict(updated_session)
 
+    def _is_jewelry_assigned(self, jewelry_item_id: str) -> bool:
+        """Check whether jewelry item is held by an unfinished session (cache first)"""
+        if self.cache_service and self.cache_service.get(jewelry_active_session_key(jewelry_item_id)):
+            return True
+        return self.session_item_repository.has_active_assignment(jewelry_item_id)
+    
+    def _invalidate_session_cache(self, session_id: str):
+        """Drop cached session detail, items and statistics after a session write"""
+        if self.cache_service:
+            self.cache_service.delete(*session_cache_keys(session_id))
+    
+    def _invalidate_sessions_cache(self, session_ids: List[str]):
+        """Drop cached entries for many sessions with a single multi-key DEL"""
+        if self.cache_service:
+            self.cache_service.delete(*(key for session_id in session_ids
+                                        for key in session_cache_keys(session_id)))
+    
     def _generate_session_code(self) -> str:
         """Generate unique session code"""
         while True:
@@ -354,12 +431,7 @@ class AuctionService:
     
     def _generate_lot_number(self, session_id: str) -> int:
         """Generate next lot number for session"""
-        existing_items = self.session_item_repository.get_by_session_id(session_id)
-        if not existing_items:
-            return 1
-        
-        max_lot = max(item.lot_number for item in existing_items)
-        return max_lot + 1
+        return self.session_item_repository.get_next_lot_number(session_id)
     
     def _session_to_dict(self, session: AuctionSession) -> Dict[str, Any]:
         """Convert auction session to dictionary"""
@@ -373,6 +445,9 @@ class AuctionService:
             'status': session.status.value,
             'assigned_staff_id': session.assigned_staff_id,
             'rules': session.rules,
+            'bid_count': session.bid_count,
+            'highest_bid_amount': float(session.highest_bid_amount) if session.highest_bid_amount else None,
+            'highest_bidder_id': session.highest_bidder_id,
             'created_at': session.created_at.isoformat() if session.created_at else None,
             'updated_at': session.updated_at.isoformat() if session.updated_at else None,
             'opened_at': session.opened_at.isoformat() if session.opened_at else None,
@@ -452,7 +527,7 @@ class AuctionService:
         """Assign jewelry items to auction session (MANAGER only)"""
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
 
         if session.status != SessionStatus.DRAFT:
             raise BusinessRuleViolationError("Can only assign items to draft sessions")
@@ -465,23 +540,24 @@ class AuctionService:
             raise ValidationError("At least one jewelry item ID is required")
 
         assigned_items = []
+        next_lot_number = self._generate_lot_number(session_id)
 
         for jewelry_item_id in jewelry_item_ids:
             # Check if jewelry item exists and is approved
             jewelry_item = self.jewelry_repository.get_by_id(jewelry_item_id)
             if not jewelry_item:
-                raise NotFoundError(f"Jewelry item {jewelry_item_id} not found")
+                raise NotFoundError(f"Jewelry item {jewelry_item_id} not found", CODE_JEWELRY_NOT_FOUND)
 
             if jewelry_item.status != JewelryStatus.APPROVED:
                 raise BusinessRuleViolationError(f"Jewelry item {jewelry_item_id} is not approved for auction")
 
             # Check if item is already in another active session
-            existing_session_item = self.session_item_repository.get_by_jewelry_item_id(jewelry_item_id)
-            if existing_session_item:
+            if self._is_jewelry_assigned(jewelry_item_id):
                 raise BusinessRuleViolationError(f"Jewelry item {jewelry_item_id} is already assigned to another session")
 
             # Create session item
-            lot_number = self._generate_lot_number(session_id)
+            lot_number = next_lot_number
+            next_lot_number += 1
             start_price = Decimal(str(start_prices.get(jewelry_item_id, 1.00)))
             step_price = Decimal(str(step_prices.get(jewelry_item_id, 1.00)))
 
@@ -496,12 +572,15 @@ class AuctionService:
 
             created_item = self.session_item_repository.create(session_item)
             assigned_items.append(self._session_item_to_dict(created_item))
+            if self.cache_service:
+                self.cache_service.set(jewelry_active_session_key(jewelry_item_id), session_id, CACHE_TTL_LONG_SECONDS)
 
             # Update jewelry item status
             jewelry_item.status = JewelryStatus.IN_AUCTION
             self.jewelry_repository.update(jewelry_item)
 
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
 
         return {
             'session_id': session_id,
@@ -509,14 +588,15 @@ class AuctionService:
             'total_assigned': len(assigned_items)
         }
 
-    def open_session(self, session_id: str, user_id: str) -> Dict[str, Any]:
+    def open_session(self, session_id: str, user_id: str, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Open an auction session for bidding (MANAGER only)"""
+        now = now or datetime.utcnow()
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
 
         if session.status != SessionStatus.DRAFT:
-            raise BusinessRuleViolationError(f"Cannot open session with status {session.status.value}")
+            raise BusinessRuleViolationError(f"Cannot open session with status {session.status.value}", CODE_INVALID_SESSION_STATUS)
 
         # Check if session has items
         session_items = self.session_item_repository.get_by_session_id(session_id)
@@ -525,25 +605,80 @@ class AuctionService:
 
         # Update session status
         session.status = SessionStatus.OPEN
-        session.opened_at = datetime.utcnow()
+        session.opened_at = now
 
         updated_session = self.session_repository.update(session)
         self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
 
         return self._session_to_dict(updated_session)
 
-    def close_session(self, session_id: str, user_id: str) -> Dict[str, Any]:
+    def close_session(self, session_id: str, user_id: str, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Close an auction session and determine winners (MANAGER only)"""
+        now = now or datetime.utcnow()
         session = self.session_repository.get_by_id(session_id)
         if not session:
-            raise NotFoundError("Auction session not found")
+            raise NotFoundError(ERR_SESSION_NOT_FOUND, CODE_SESSION_NOT_FOUND)
 
-        if session.status != SessionStatus.OPEN:
-            raise BusinessRuleViolationError(f"Cannot close session with status {session.status.value}")
+        # Guarded transition: only one concurrent closer can move OPEN -> CLOSED
+        if not self.session_repository.transition_status(
+                session_id, (SessionStatus.OPEN,), SessionStatus.CLOSED, closed_at=now):
+            # session.status may predate a concurrent close, so don't echo it
+            raise BusinessRuleViolationError("Can only close open sessions", CODE_INVALID_SESSION_STATUS)
 
         # Get all session items and determine winners
         session_items = self.session_item_repository.get_by_session_id(session_id)
+        winners = self._settle_closed_items(session_items)
+
+        self.session_repository.commit()
+        self._invalidate_session_cache(session_id)
+
+        return {
+            'session': self._session_to_dict(session),
+            'winners': winners,
+            'total_winners': len(winners)
+        }
+
+    def open_due_sessions(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Open every scheduled session whose start time has arrived, in one sweep"""
+        now = now or datetime.utcnow()
+        session_ids = self.session_repository.open_due_scheduled(now)
+        if not session_ids:
+            return {'opened_session_ids': []}
+
+        self.session_repository.commit()
+        self._invalidate_sessions_cache(session_ids)
+
+        return {'opened_session_ids': session_ids}
+
+    def close_expired_sessions(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Close every open session whose end time has passed, in one transaction"""
+        now = now or datetime.utcnow()
+        expired_sessions = self.session_repository.list_expired_open(now)
+
+        # Guarded close per session: skip any closed manually or extended by a
+        # late bid since the read, so only sessions we closed get settled
+        session_ids = [session.id for session in expired_sessions
+                       if self.session_repository.close_if_expired(session.id, now)]
+        if not session_ids:
+            return {'closed_session_ids': [], 'total_winners': 0}
+
+        session_items = self.session_item_repository.get_by_session_ids(session_ids)
+        winners = self._settle_closed_items(session_items)
+
+        self.session_repository.commit()
+        self._invalidate_sessions_cache(session_ids)
+
+        return {
+            'closed_session_ids': session_ids,
+            'total_winners': len(winners)
+        }
+
+    def _settle_closed_items(self, session_items) -> List[Dict[str, Any]]:
+        """Collect winners and mark jewelry items SOLD/UNSOLD with one bulk UPDATE each"""
         winners = []
+        sold_ids = []
+        unsold_ids = []
 
         for session_item in session_items:
             if session_item.current_highest_bid and session_item.current_winner_id:
@@ -554,28 +689,17 @@ class AuctionService:
                     'winner_id': session_item.current_winner_id,
                     'winning_bid': float(session_item.current_highest_bid)
                 })
-
-                # Update jewelry item status to SOLD
-                jewelry_item = self.jewelry_repository.get_by_id(session_item.jewelry_item_id)
-                if jewelry_item:
-                    jewelry_item.status = JewelryStatus.SOLD
-                    self.jewelry_repository.update(jewelry_item)
+                sold_ids.append(session_item.jewelry_item_id)
             else:
                 # No bids - mark as unsold
-                jewelry_item = self.jewelry_repository.get_by_id(session_item.jewelry_item_id)
-                if jewelry_item:
-                    jewelry_item.status = JewelryStatus.UNSOLD
-                    self.jewelry_repository.update(jewelry_item)
+                unsold_ids.append(session_item.jewelry_item_id)
 
-        # Update session status
-        session.status = SessionStatus.CLOSED
-        session.closed_at = datetime.utcnow()
+        self.jewelry_repository.bulk_update_status(sold_ids, JewelryStatus.SOLD)
+        self.jewelry_repository.bulk_update_status(unsold_ids, JewelryStatus.UNSOLD)
 
-        updated_session = self.session_repository.update(session)
-        self.session_repository.commit()
+        # Items are released from their session once it closes (one multi-key DEL)
+        if self.cache_service:
+            self.cache_service.delete(*(jewelry_active_session_key(jewelry_item_id)
+                                        for jewelry_item_id in sold_ids + unsold_ids))
 
-        return {
-            'session': self._session_to_dict(updated_session),
-            'winners': winners,
-            'total_winners': len(winners)
-        }
+        return winners
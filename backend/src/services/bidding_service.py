@@ -1,11 +1,11 @@
 """
 Bidding service for the Jewelry Auction System
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 from domain.entities.bid import Bid
-from domain.enums import SessionStatus, BidStatus, EnrollmentStatus
+from domain.enums import SessionStatus, BidStatus
 from domain.exceptions import (
     ValidationError, 
     NotFoundError, 
@@ -20,12 +20,37 @@ from domain.repositories.base_repository import (
     ISessionItemRepository, 
     IEnrollmentRepository
 )
+from domain.constants import (
+    SESSION_STATS_CACHE_TTL_SECONDS,
+    BID_CONFLICT_MAX_ATTEMPTS,
+    BID_CONFLICT_BACKOFF_SECONDS
+)
 from infrastructure.databases.mssql import get_db_session
+from infrastructure.services.cache_service import CacheService, session_stats_key, session_cache_keys
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import text
+import operator
+import random
+import threading
+import time
 import uuid
 
 
+ERR_CONCURRENT_BID = "Another bid was placed simultaneously. Please try again."
+
+_bid_amount = operator.attrgetter('amount')
+
+# Bids on the same lot are handed to one writer at a time within this process, so
+# request threads queue on a lock instead of racing to the DB and retrying version
+# conflicts. Locks are striped to bound memory; the version check still guards
+# against writers in other processes.
+_BID_LOCK_STRIPES = tuple(threading.Lock() for _ in range(64))
+
+
+def _bid_lock(session_item_id: str) -> threading.Lock:
+    """Lock serializing bid writes for a session item in this process"""
+    return _BID_LOCK_STRIPES[hash(session_item_id) % len(_BID_LOCK_STRIPES)]
+
+
 class BiddingService:
     """Bidding service with transactional support"""
     
@@ -33,15 +58,31 @@ class BiddingService:
                  bid_repository: IBidRepository,
                  session_repository: IAuctionSessionRepository,
                  session_item_repository: ISessionItemRepository,
-                 enrollment_repository: IEnrollmentRepository):
+                 enrollment_repository: IEnrollmentRepository,
+                 cache_service: Optional[CacheService] = None):
         self.bid_repository = bid_repository
         self.session_repository = session_repository
         self.session_item_repository = session_item_repository
         self.enrollment_repository = enrollment_repository
+        self.cache_service = cache_service
     
     def place_bid(self, session_id: str, session_item_id: str, bidder_id: str, 
-                  amount: Decimal, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+                  amount: Decimal, idempotency_key: Optional[str] = None,
+                  now: Optional[datetime] = None) -> Dict[str, Any]:
         """Place a bid with transactional safety and business rules"""
+        return self._retry_on_conflict(
+            session_item_id, self._place_bid_once, session_id, session_item_id,
+            bidder_id, amount, idempotency_key, now
+        )
+    
+    def _place_bid_once(self, session_id: str, session_item_id: str, bidder_id: str,
+                        amount: Decimal, idempotency_key: Optional[str] = None,
+                        now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Single optimistic attempt at placing a bid"""
+        now = now or datetime.utcnow()
+        
+        if amount <= 0:
+            raise ValidationError("Bid amount must be positive")
         
         # Check for duplicate bid using idempotency key
         if idempotency_key:
@@ -49,99 +90,69 @@ class BiddingService:
             if existing_bid:
                 return self._bid_to_dict(existing_bid)
         
-        # Get session with lock
-        session = self.session_repository.get_by_id_with_lock(session_id)
-        if not session:
-            raise NotFoundError("Auction session not found")
-        
-        # Check session status
-        if session.status != SessionStatus.OPEN:
-            raise BusinessRuleViolationError("Bidding is only allowed when session is open")
-        
-        # Check if session has ended
-        if session.end_at and datetime.utcnow() > session.end_at:
-            raise BusinessRuleViolationError("Auction session has ended")
-        
-        # Get session item with optimistic lock
-        session_item = self.session_item_repository.get_by_id_with_lock(session_item_id)
-        if not session_item or session_item.session_id != session_id:
-            raise NotFoundError("Session item not found")
-        
-        # Check user enrollment
-        enrollment = self.enrollment_repository.get_by_session_and_user(session_id, bidder_id)
-        if not enrollment or enrollment.status != EnrollmentStatus.APPROVED:
-            raise BusinessRuleViolationError("User must be enrolled and approved to bid")
-        
-        # Validate bid amount
-        is_valid, error_message = BiddingRules.can_place_bid(
-            bid_amount=amount,
-            current_highest_bid=session_item.current_highest_bid,
-            step_price=session_item.step_price,
-            reserve_price=session_item.reserve_price,
-            current_winner_id=session_item.current_winner_id,
-            bidder_id=bidder_id
-        )
-        
-        if not is_valid:
-            raise BusinessRuleViolationError(error_message)
-        
+        db_session = get_db_session()
         try:
-            # Start database transaction
-            db_session = get_db_session()
+            # Get session item and its session in one round trip
+            session_item = self.session_item_repository.get_by_id_with_session(session_item_id)
+            if not session_item or session_item.session_id != session_id:
+                raise NotFoundError("Session item not found")
+            session = session_item.session
             
-            # Create bid
-            bid = Bid(
-                session_id=session_id,
-                session_item_id=session_item_id,
-                bidder_id=bidder_id,
-                amount=amount,
-                placed_at=datetime.utcnow(),
-                status=BidStatus.VALID,
-                idempotency_key=idempotency_key
+            # Check session status
+            if session.status != SessionStatus.OPEN:
+                raise BusinessRuleViolationError("Bidding is only allowed when session is open")
+            
+            # Check if session has ended
+            if session.end_at and now > session.end_at:
+                raise BusinessRuleViolationError("Auction session has ended")
+            
+            # Validate bid amount
+            is_valid, error_message = BiddingRules.validate_bid_amount(
+                bid_amount=amount,
+                current_price=session_item.current_highest_bid or session_item.start_price,
+                bid_increment=session_item.step_price,
+                reserve_price=session_item.reserve_price
             )
             
-            # Save bid
-            created_bid = self.bid_repository.create(bid)
+            if not is_valid:
+                raise BusinessRuleViolationError(error_message)
             
-            # Update session item with optimistic locking
-            old_version = session_item.version
-            session_item.current_highest_bid = amount
-            session_item.current_winner_id = bidder_id
-            session_item.bid_count += 1
-            session_item.version += 1
-            session_item.updated_at = datetime.utcnow()
+            if session_item.current_winner_id == bidder_id:
+                raise BusinessRuleViolationError("You are already the highest bidder")
             
-            # Update with version check
-            updated_rows = db_session.execute(
-                text("""
-                    UPDATE session_items 
-                    SET current_highest_bid = :bid_amount,
-                        current_winner_id = :winner_id,
-                        bid_count = bid_count + 1,
-                        version = version + 1,
-                        updated_at = :updated_at
-                    WHERE id = :item_id AND version = :old_version
-                """),
-                {
-                    'bid_amount': float(amount),
-                    'winner_id': bidder_id,
-                    'updated_at': datetime.utcnow(),
-                    'item_id': session_item_id,
-                    'old_version': old_version
-                }
-            ).rowcount
+            # Check user enrollment (last: needs a DB round trip)
+            if not self.enrollment_repository.is_approved(session_id, bidder_id):
+                raise BusinessRuleViolationError("User must be enrolled and approved to bid")
             
-            if updated_rows == 0:
-                raise ConcurrencyError("Another bid was placed simultaneously. Please try again.")
+            # Create bid
+            created_bid = self.bid_repository.create({
+                'session_id': session_id,
+                'session_item_id': session_item_id,
+                'bidder_id': bidder_id,
+                'amount': amount,
+                'placed_at': now,
+                'status': BidStatus.VALID,
+                'idempotency_key': idempotency_key
+            })
+            
+            # Update session item only if no other bid landed since we read it
+            if not self.session_item_repository.apply_bid(
+                session_item_id, session_item.version, amount, bidder_id, now
+            ):
+                raise ConcurrencyError(ERR_CONCURRENT_BID)
             
             # Mark previous bids as outbid
             self.bid_repository.mark_previous_bids_as_outbid(session_item_id, created_bid.id)
             
-            # Check for anti-sniping
-            self._check_anti_sniping(session, created_bid)
+            # Maintain session-level bid counters and apply anti-sniping in one UPDATE
+            self.session_repository.record_bid(
+                session_id, amount, bidder_id,
+                extend_end_at=self._anti_sniping_end_at(session, now)
+            )
             
             # Commit transaction
             db_session.commit()
+            self._invalidate_session_cache(session_id)
             
             # TODO: Send real-time notifications
             # self._notify_bid_placed(created_bid, session_item)
@@ -150,10 +161,10 @@ class BiddingService:
             
         except IntegrityError:
             db_session.rollback()
-            raise ConcurrencyError("Another bid was placed simultaneously. Please try again.")
-        except Exception as e:
+            raise ConcurrencyError(ERR_CONCURRENT_BID)
+        except Exception:
             db_session.rollback()
-            raise e
+            raise
     
     def get_bid(self, bid_id: str) -> Optional[Dict[str, Any]]:
         """Get bid by ID"""
@@ -163,11 +174,20 @@ class BiddingService:
         
         return self._bid_to_dict(bid)
     
-    def get_session_bids(self, session_id: str, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
-        """Get all bids for a session"""
-        result = self.bid_repository.get_by_session_id(session_id, page, page_size)
+    def get_session_bids(self, session_id: str, page: int = 1, page_size: int = 50,
+                         status: Optional[BidStatus] = None,
+                         before: Optional[Tuple[datetime, str]] = None) -> Dict[str, Any]:
+        """Get bids for a session, optionally filtered by status and paged by cursor"""
+        result = self.bid_repository.get_by_session_id(
+            session_id, page, page_size, status=status, before=before
+        )
         bids = result['items']  # Extract bids from repository result
-        total_count = self.bid_repository.count_by_session_id(session_id)
+        total_count = result['total']  # Already counted by the repository query
+        
+        # Cursor for the next page: "<placed_at>|<id>" of the oldest bid returned
+        next_cursor = None
+        if len(bids) == page_size:
+            next_cursor = f"{bids[-1].placed_at.isoformat()}|{bids[-1].id}"
 
         return {
             'items': [self._bid_to_dict(bid) for bid in bids],
@@ -175,7 +195,8 @@ class BiddingService:
                 'page': page,
                 'page_size': page_size,
                 'total_count': total_count,
-                'total_pages': (total_count + page_size - 1) // page_size
+                'total_pages': (total_count + page_size - 1) // page_size,
+                'next_cursor': next_cursor
             }
         }
     
@@ -183,7 +204,7 @@ class BiddingService:
         """Get all bids for a specific session item"""
         result = self.bid_repository.get_by_session_item_id(session_item_id, page, page_size)
         bids = result['items']  # Extract bids from repository result
-        total_count = self.bid_repository.count_by_session_item_id(session_item_id)
+        total_count = result['total']  # Already counted by the repository query
 
         return {
             'items': [self._bid_to_dict(bid) for bid in bids],
@@ -214,6 +235,16 @@ class BiddingService:
             }
         }
     
+    def get_user_bid_summary(self, user_id: str) -> Dict[str, Any]:
+        """Get aggregated bidding summary for a user"""
+        summary = self.bid_repository.get_user_summary(user_id)
+        
+        for key in ('average_bid_amount', 'highest_bid_amount',
+                    'lowest_bid_amount', 'total_winning_value'):
+            summary[key] = float(summary[key])
+        
+        return summary
+    
     def get_current_highest_bid(self, session_item_id: str) -> Optional[Dict[str, Any]]:
         """Get current highest bid for a session item"""
         bid = self.bid_repository.get_highest_bid_for_item(session_item_id)
@@ -223,36 +254,90 @@ class BiddingService:
         return self._bid_to_dict(bid)
     
     def get_bid_history(self, session_item_id: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get bid history for a session item"""
-        bids = self.bid_repository.get_bid_history(session_item_id, limit)
-        return [self._bid_to_dict(bid) for bid in bids]
+        """Get bid history for a session item, including bidder details"""
+        rows = self.bid_repository.get_bid_history_with_bidders(session_item_id, limit)
+        
+        # Rank valid bids by amount once, rather than re-sorting for every entry
+        ranked_bids = sorted(
+            (bid for bid, _, _ in rows if bid.status != BidStatus.INVALID),
+            key=_bid_amount,
+            reverse=True
+        )
+        position_by_id = {bid.id: index + 1 for index, bid in enumerate(ranked_bids)}
+        
+        history = []
+        for bid, bidder_name, bidder_verified in rows:
+            bid_dict = self._bid_to_dict(bid)
+            bid_dict['bidder_name'] = bidder_name
+            bid_dict['bidder_verified'] = bidder_verified
+            bid_dict['position'] = position_by_id.get(bid.id)
+            history.append(bid_dict)
+        
+        return history
     
-    def _check_anti_sniping(self, session, bid):
-        """Check and apply anti-sniping rules"""
+    def get_session_statistics(self, session_id: str) -> Dict[str, Any]:
+        """Get bidding statistics for a session (cached briefly for live polling)"""
+        cache_key = session_stats_key(session_id)
+        if self.cache_service:
+            cached = self.cache_service.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        stats = self.bid_repository.get_session_statistics(session_id)
+        result = {
+            'session_id': session_id,
+            'total_bids': stats['total_bids'],
+            'unique_bidders': stats['unique_bidders'],
+            'total_bid_value': float(stats['total_bid_value']),
+            'average_bid_amount': float(stats['average_bid_amount']),
+            'highest_bid_amount': float(stats['highest_bid_amount']),
+            'lowest_bid_amount': float(stats['lowest_bid_amount'])
+        }
+        
+        if self.cache_service:
+            self.cache_service.set(cache_key, result, SESSION_STATS_CACHE_TTL_SECONDS)
+        
+        return result
+    
+    def _retry_on_conflict(self, session_item_id: str, attempt_fn, *args):
+        """Run an optimistic bid attempt under the lot's lock, retrying version conflicts.
+
+        The lock is held per attempt only; the jittered backoff sleeps outside it
+        so other bids on the lot are not blocked.
+        """
+        for attempt in range(1, BID_CONFLICT_MAX_ATTEMPTS + 1):
+            try:
+                with _bid_lock(session_item_id):
+                    return attempt_fn(*args)
+            except ConcurrencyError:
+                if attempt == BID_CONFLICT_MAX_ATTEMPTS:
+                    raise
+                time.sleep(random.uniform(0, BID_CONFLICT_BACKOFF_SECONDS * attempt))
+    
+    def _invalidate_session_cache(self, session_id: str):
+        """Drop cached session detail, items and statistics after a bid changes them"""
+        if self.cache_service:
+            self.cache_service.delete(*session_cache_keys(session_id))
+
+    def _anti_sniping_end_at(self, session, placed_at: datetime) -> Optional[datetime]:
+        """Return the extended end time if a bid at placed_at triggers anti-sniping"""
         if not session.end_at:
-            return
+            return None
         
         # Get anti-sniping configuration from session rules or config
-        anti_sniping_enabled = session.rules.get('anti_sniping_enabled', True)
-        if not anti_sniping_enabled:
-            return
+        rules = session.rules or {}
+        if not rules.get('anti_sniping_enabled', True):
+            return None
         
-        trigger_seconds = session.rules.get('anti_sniping_trigger_seconds', 60)
-        extension_seconds = session.rules.get('anti_sniping_extension_seconds', 300)
+        trigger_seconds = rules.get('anti_sniping_trigger_seconds', 60)
+        extension_seconds = rules.get('anti_sniping_extension_seconds', 300)
         
-        # Check if bid was placed in the last trigger_seconds
-        time_until_end = (session.end_at - bid.placed_at).total_seconds()
+        # Extend only when the bid lands in the last trigger_seconds
+        if (session.end_at - placed_at).total_seconds() > trigger_seconds:
+            return None
         
-        if time_until_end <= trigger_seconds:
-            # Extend auction end time
-            new_end_time = session.end_at + timedelta(seconds=extension_seconds)
-            session.end_at = new_end_time
-            session.updated_at = datetime.utcnow()
-            
-            self.session_repository.update(session)
-            
-            # TODO: Notify about time extension
-            # self._notify_time_extension(session, extension_seconds)
+        # TODO: Notify about time extension
+        return session.end_at + timedelta(seconds=extension_seconds)
     
     def _bid_to_dict(self, bid: Bid) -> Dict[str, Any]:
         """Convert bid to dictionary"""
@@ -272,91 +357,81 @@ class BiddingService:
 
     def get_session_item_bids(self, session_id: str, item_id: str, page: int = 1, limit: int = 20) -> Dict[str, Any]:
         """Get bids for a specific session item with pagination"""
-        # First verify session and item exist
-        session = self.session_repository.get_by_id(session_id)
-        if not session:
-            raise NotFoundError("Auction session not found")
-
-        session_item = self.session_item_repository.get_by_id(item_id)
+        # Verify session and item exist (one query)
+        session_item = self.session_item_repository.get_by_id_with_session(item_id)
         if not session_item or session_item.session_id != session_id:
             raise NotFoundError("Session item not found")
 
-        # Get bids with pagination
-        bids = self.bid_repository.get_by_session_item_id(item_id, page, limit)
-        total_count = self.bid_repository.count_by_session_item_id(item_id)
+        # Get bids with pagination (repository returns the page and its total)
+        result = self.bid_repository.get_by_session_item_id(item_id, page, limit)
 
         return {
-            'items': [self._bid_to_dict(bid) for bid in bids],
-            'total': total_count,
+            'items': [self._bid_to_dict(bid) for bid in result['items']],
+            'total': result['total'],
             'page': page,
             'limit': limit
         }
 
-    def place_session_item_bid(self, session_id: str, item_id: str, user_id: str, amount: Decimal) -> Dict[str, Any]:
+    def place_session_item_bid(self, session_id: str, item_id: str, user_id: str, amount: Decimal,
+                               now: Optional[datetime] = None) -> Dict[str, Any]:
         """Place a bid on a specific session item"""
-        # Verify session exists and is open
-        session = self.session_repository.get_by_id(session_id)
-        if not session:
-            raise NotFoundError("Auction session not found")
-
-        if session.status != SessionStatus.OPEN:
-            raise BusinessRuleViolationError("Session is not open for bidding")
+        return self._retry_on_conflict(
+            item_id, self._place_session_item_bid_once, session_id, item_id, user_id, amount, now
+        )
 
-        # Verify session item exists
-        session_item = self.session_item_repository.get_by_id(item_id)
-        if not session_item or session_item.session_id != session_id:
-            raise NotFoundError("Session item not found")
+    def _place_session_item_bid_once(self, session_id: str, item_id: str, user_id: str, amount: Decimal,
+                                     now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Single optimistic attempt at placing a session item bid"""
+        now = now or datetime.utcnow()
+        try:
+            # Load session item together with its session
+            session_item = self.session_item_repository.get_by_id_with_session(item_id)
+            if not session_item or session_item.session_id != session_id:
+                raise NotFoundError("Session item not found")
 
-        # Check if user is enrolled in session
-        enrollment = self.enrollment_repository.get_by_session_and_user(session_id, user_id)
-        if not enrollment or enrollment.status != EnrollmentStatus.APPROVED:
-            raise BusinessRuleViolationError("User is not enrolled in this session")
+            # Verify session is open
+            session = session_item.session
+            if session.status != SessionStatus.OPEN:
+                raise BusinessRuleViolationError("Session is not open for bidding")
 
-        # Validate bid amount
-        min_bid = session_item.current_highest_bid or session_item.start_price
-        min_bid += session_item.step_price
+            # Validate bid amount
+            min_bid = session_item.current_highest_bid or session_item.start_price
+            min_bid += session_item.step_price
 
-        if amount < min_bid:
-            raise BusinessRuleViolationError(f"Bid must be at least {min_bid}")
+            if amount < min_bid:
+                raise BusinessRuleViolationError(f"Bid must be at least {min_bid}")
 
-        # Create and place bid
-        bid = Bid(
-            session_id=session_id,
-            session_item_id=item_id,
-            bidder_id=user_id,
-            amount=amount,
-            placed_at=datetime.utcnow(),
-            status=BidStatus.VALID
-        )
+            # Check if user is enrolled in session (last: needs a DB round trip)
+            if not self.enrollment_repository.is_approved(session_id, user_id):
+                raise BusinessRuleViolationError("User is not enrolled in this session")
 
-        try:
-            # Start transaction
-            created_bid = self.bid_repository.create(bid)
+            # Create and place bid (winning: it beat the version check below)
+            created_bid = self.bid_repository.create({
+                'session_id': session_id,
+                'session_item_id': item_id,
+                'bidder_id': user_id,
+                'amount': amount,
+                'placed_at': now,
+                'status': BidStatus.WINNING
+            })
 
-            # Update session item with new highest bid
-            session_item.current_highest_bid = amount
-            session_item.current_winner_id = user_id
-            session_item.bid_count += 1
-            session_item.version += 1  # For optimistic locking
+            # Update session item only if no other bid landed since we read it
+            if not self.session_item_repository.apply_bid(
+                item_id, session_item.version, amount, user_id, now
+            ):
+                raise ConcurrencyError(ERR_CONCURRENT_BID)
 
-            self.session_item_repository.update(session_item)
+            self.session_repository.record_bid(session_id, amount, user_id)
 
             # Mark previous bids as outbid
-            previous_bids = self.bid_repository.get_by_session_item_id(item_id)
-            for prev_bid in previous_bids:
-                if prev_bid.id != created_bid.id and prev_bid.status == BidStatus.WINNING:
-                    prev_bid.status = BidStatus.OUTBID
-                    self.bid_repository.update(prev_bid)
-
-            # Mark current bid as winning
-            created_bid.status = BidStatus.WINNING
-            updated_bid = self.bid_repository.update(created_bid)
+            self.bid_repository.mark_previous_bids_as_outbid(item_id, created_bid.id)
 
             # Commit transaction
             self.bid_repository.commit()
+            self._invalidate_session_cache(session_id)
 
-            return self._bid_to_dict(updated_bid)
+            return self._bid_to_dict(created_bid)
 
-        except Exception as e:
+        except Exception:
             self.bid_repository.rollback()
-            raise e
+            raise
@@ -21,6 +21,10 @@ import random
 import string
 
 
+# Roles with staff-level access to every item and sell request
+_STAFF_ROLES = frozenset((UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN))
+
+
 class JewelryService:
     """Jewelry management service"""
     
@@ -125,15 +129,12 @@ class JewelryService:
             raise NotFoundError("Jewelry item not found")
         
         # Check permissions
-        if jewelry_item.owner_user_id != user_id and user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if jewelry_item.owner_user_id != user_id and user_role not in _STAFF_ROLES:
             raise AuthorizationError("Not authorized to update this item")
         
-        # Update allowed fields
-        if 'title' in updates:
-            jewelry_item.update_details(title=updates['title'])
-        
-        if 'description' in updates:
-            jewelry_item.update_details(description=updates['description'])
+        # Update allowed fields (title and description in one call)
+        if 'title' in updates or 'description' in updates:
+            jewelry_item.update_details(title=updates.get('title'), description=updates.get('description'))
         
         if 'attributes' in updates:
             jewelry_item.update_attributes(updates['attributes'])
@@ -143,7 +144,7 @@ class JewelryService:
             jewelry_item.updated_at = datetime.utcnow()
         
         # Staff can update pricing
-        if user_role in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if user_role in _STAFF_ROLES:
             if 'estimated_price' in updates:
                 jewelry_item.set_estimated_price(Decimal(str(updates['estimated_price'])))
             
@@ -159,7 +160,7 @@ class JewelryService:
     def update_jewelry_status(self, item_id: str, new_status: JewelryStatus, user_role: UserRole) -> Dict[str, Any]:
         """Update jewelry item status"""
         # Only staff and above can change status
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if user_role not in _STAFF_ROLES:
             raise AuthorizationError("Not authorized to change item status")
         
         jewelry_item = self.jewelry_repository.get_by_id(item_id)
@@ -182,7 +183,7 @@ class JewelryService:
             raise NotFoundError("Jewelry item not found")
         
         # Check permissions
-        if jewelry_item.owner_user_id != user_id and user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if jewelry_item.owner_user_id != user_id and user_role not in _STAFF_ROLES:
             raise AuthorizationError("Not authorized to modify this item")
         
         # Add photo
@@ -201,7 +202,7 @@ class JewelryService:
             raise NotFoundError("Jewelry item not found")
         
         # Check permissions
-        if jewelry_item.owner_user_id != user_id and user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if jewelry_item.owner_user_id != user_id and user_role not in _STAFF_ROLES:
             raise AuthorizationError("Not authorized to modify this item")
         
         # Remove photo
@@ -288,7 +289,7 @@ class JewelryService:
     def create_jewelry_item(self, user_id: str, user_role: UserRole, jewelry_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new jewelry item (STAFF/MANAGER/ADMIN only)"""
         # Check authorization
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if user_role not in _STAFF_ROLES:
             raise AuthorizationError("Not authorized to create jewelry items")
 
         # Validate required fields
@@ -3,7 +3,7 @@ Payment service for the Jewelry Auction System
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from domain.entities.payment import Payment
 from domain.entities.payout import Payout
 from domain.entities.refund import Refund
@@ -12,7 +12,8 @@ from domain.exceptions import (
     ValidationError, 
     NotFoundError, 
     BusinessRuleViolationError,
-    AuthorizationError
+    AuthorizationError,
+    PaymentError
 )
 from domain.business_rules import PaymentRules
 from domain.repositories.base_repository import (
@@ -27,9 +28,23 @@ from infrastructure.services.payment_gateway import PaymentGatewayService
 import uuid
 
 
+# Money columns are DECIMAL(12, 2)
+_CENT = Decimal('0.01')
+
+
+# Gateway client holds only credentials, so one instance serves every request
+_gateway = PaymentGatewayService()
+
+
 class PaymentService:
     """Payment processing service"""
     
+    __slots__ = (
+        'payment_repository', 'payout_repository', 'refund_repository',
+        'session_item_repository', 'session_repository', 'fee_repository',
+        'gateway'
+    )
+    
     def __init__(self, 
                  payment_repository: IPaymentRepository,
                  payout_repository: IPayoutRepository,
@@ -43,11 +58,11 @@ class PaymentService:
         self.session_item_repository = session_item_repository
         self.session_repository = session_repository
         self.fee_repository = fee_repository
-        self.gateway = PaymentGatewayService()
+        self.gateway = _gateway
     
     def create_payment(self, session_item_id: str, buyer_id: str, payment_method: PaymentMethod) -> Dict[str, Any]:
         """Create payment for winning bid"""
-        session_item = self.session_item_repository.get_by_id(session_item_id)
+        session_item = self.session_item_repository.get_by_id_with_session(session_item_id)
         if not session_item:
             raise NotFoundError("Session item not found")
         
@@ -56,12 +71,12 @@ class PaymentService:
             raise BusinessRuleViolationError("Only the winning bidder can make payment")
         
         # Check if session is closed
-        session = self.session_repository.get_by_id(session_item.session_id)
+        session = session_item.session
         if session.status != SessionStatus.CLOSED:
             raise BusinessRuleViolationError("Payment can only be made after auction is closed")
         
-        # Check if payment already exists
-        existing_payment = self.payment_repository.get_by_session_item_id(session_item_id)
+        # Check if an active payment already exists (canceled ones don't count)
+        existing_payment = self.payment_repository.get_active_by_session_item_id(session_item_id, buyer_id)
         if existing_payment:
             return self._payment_to_dict(existing_payment)
         
@@ -98,49 +113,57 @@ class PaymentService:
         if payment.status != PaymentStatus.PENDING:
             raise BusinessRuleViolationError("Payment is not in pending status")
         
+        # Update status to processing
+        payment.status = PaymentStatus.PROCESSING
+        payment.updated_at = datetime.utcnow()
+        self.payment_repository.update(payment)
+        self.payment_repository.commit()
+        
+        # Process through gateway; only a failed gateway call marks the payment failed
         try:
-            # Update status to processing
-            payment.status = PaymentStatus.PROCESSING
-            payment.updated_at = datetime.utcnow()
-            self.payment_repository.update(payment)
-            self.payment_repository.commit()
-            
-            # Process through gateway
             gateway_response = self.gateway.process_payment(
                 amount=payment.amount,
                 method=payment.method,
                 details=payment_details
             )
-            
-            if gateway_response['success']:
-                # Payment successful
-                payment.status = PaymentStatus.COMPLETED
-                payment.paid_at = datetime.utcnow()
-                payment.gateway_transaction_id = gateway_response.get('transaction_id')
-                payment.gateway_response = gateway_response
-                
-                # Create corresponding payout
-                self._create_seller_payout(payment)
-                
-            else:
-                # Payment failed
-                payment.status = PaymentStatus.FAILED
-                payment.gateway_response = gateway_response
-            
-            payment.updated_at = datetime.utcnow()
-            updated_payment = self.payment_repository.update(payment)
-            self.payment_repository.commit()
-            
-            return self._payment_to_dict(updated_payment)
-            
         except Exception as e:
-            # Mark payment as failed
             payment.status = PaymentStatus.FAILED
             payment.gateway_response = {'error': str(e)}
             payment.updated_at = datetime.utcnow()
             self.payment_repository.update(payment)
             self.payment_repository.commit()
-            raise e
+            raise
+        
+        now = datetime.utcnow()
+        if gateway_response['success']:
+            # Payment successful
+            payment.status = PaymentStatus.COMPLETED
+            payment.paid_at = now
+            payment.gateway_transaction_id = gateway_response.get('transaction_id')
+            payment.gateway_response = gateway_response
+        else:
+            # Payment failed
+            payment.status = PaymentStatus.FAILED
+            payment.gateway_response = gateway_response
+        
+        payment.updated_at = now
+        updated_payment = self.payment_repository.update(payment)
+        self.payment_repository.commit()
+        
+        if gateway_response['success']:
+            # The capture is already recorded; a failed payout must not undo it
+            try:
+                self._create_seller_payout(payment)
+                self.payout_repository.commit()
+            except Exception as e:
+                self.payout_repository.rollback()
+                raise PaymentError(
+                    f"Payment {payment_id} captured (transaction "
+                    f"{payment.gateway_transaction_id}) but seller payout failed; needs reconciliation",
+                    "PAYOUT_RECONCILIATION_REQUIRED"
+                ) from e
+        
+        return self._payment_to_dict(updated_payment)
     
     def get_payment(self, payment_id: str) -> Optional[Dict[str, Any]]:
         """Get payment by ID"""
@@ -183,8 +206,7 @@ class PaymentService:
             raise ValidationError("Refund amount cannot exceed payment amount")
         
         # Check if refund already exists
-        existing_refund = self.refund_repository.get_by_payment_id(payment_id)
-        if existing_refund:
+        if self.refund_repository.exists_for_payment(payment_id):
             raise BusinessRuleViolationError("Refund already exists for this payment")
         
         # Create refund
@@ -226,15 +248,16 @@ class PaymentService:
                 amount=refund.amount
             )
             
+            now = datetime.utcnow()
             if gateway_response['success']:
                 # Refund successful
                 refund.status = PaymentStatus.REFUNDED
-                refund.refunded_at = datetime.utcnow()
+                refund.refunded_at = now
                 refund.gateway_refund_id = gateway_response.get('refund_id')
                 
                 # Update original payment status
                 payment.status = PaymentStatus.REFUNDED
-                payment.updated_at = datetime.utcnow()
+                payment.updated_at = now
                 self.payment_repository.update(payment)
                 
             else:
@@ -242,7 +265,7 @@ class PaymentService:
                 refund.status = PaymentStatus.FAILED
             
             refund.gateway_response = gateway_response
-            refund.updated_at = datetime.utcnow()
+            refund.updated_at = now
             updated_refund = self.refund_repository.update(refund)
             self.refund_repository.commit()
             
@@ -255,7 +278,7 @@ class PaymentService:
             refund.updated_at = datetime.utcnow()
             self.refund_repository.update(refund)
             self.refund_repository.commit()
-            raise e
+            raise
     
     def get_payout(self, payout_id: str) -> Optional[Dict[str, Any]]:
         """Get payout by ID"""
@@ -283,8 +306,8 @@ class PaymentService:
     
     def _create_seller_payout(self, payment: Payment):
         """Create payout for seller when payment is completed"""
-        session_item = self.session_item_repository.get_by_id(payment.session_item_id)
-        session = self.session_repository.get_by_id(session_item.session_id)
+        session_item = self.session_item_repository.get_by_id_with_session(payment.session_item_id)
+        session = session_item.session
         
         # Get jewelry item to find seller
         # This would need to be implemented based on your repository structure
@@ -310,11 +333,13 @@ class PaymentService:
     def _calculate_buyer_fee(self, amount: Decimal, session_rules: Dict[str, Any]) -> Decimal:
         """Calculate buyer fee"""
         # Get fee configuration from session rules or default
-        fee_percentage = session_rules.get('buyer_fee_percentage', Decimal('10.0'))  # 10% default
-        min_fee = session_rules.get('buyer_min_fee', Decimal('5.0'))
+        # Session rules are stored as JSON, so coerce via str to keep Decimal math exact
+        fee_percentage = Decimal(str(session_rules.get('buyer_fee_percentage', '10.0')))  # 10% default
+        min_fee = Decimal(str(session_rules.get('buyer_min_fee', '5.0')))
         max_fee = session_rules.get('buyer_max_fee')
+        max_fee = Decimal(str(max_fee)) if max_fee else None
         
-        fee = amount * (fee_percentage / 100)
+        fee = amount * fee_percentage / 100
         
         if fee < min_fee:
             fee = min_fee
@@ -322,16 +347,18 @@ class PaymentService:
         if max_fee and fee > max_fee:
             fee = max_fee
         
-        return fee
+        return fee.quantize(_CENT, rounding=ROUND_HALF_UP)
     
     def _calculate_seller_fee(self, amount: Decimal, session_rules: Dict[str, Any]) -> Decimal:
         """Calculate seller fee"""
         # Get fee configuration from session rules or default
-        fee_percentage = session_rules.get('seller_fee_percentage', Decimal('15.0'))  # 15% default
-        min_fee = session_rules.get('seller_min_fee', Decimal('10.0'))
+        # Session rules are stored as JSON, so coerce via str to keep Decimal math exact
+        fee_percentage = Decimal(str(session_rules.get('seller_fee_percentage', '15.0')))  # 15% default
+        min_fee = Decimal(str(session_rules.get('seller_min_fee', '10.0')))
         max_fee = session_rules.get('seller_max_fee')
+        max_fee = Decimal(str(max_fee)) if max_fee else None
         
-        fee = amount * (fee_percentage / 100)
+        fee = amount * fee_percentage / 100
         
         if fee < min_fee:
             fee = min_fee
@@ -339,7 +366,7 @@ class PaymentService:
         if max_fee and fee > max_fee:
             fee = max_fee
         
-        return fee
+        return fee.quantize(_CENT, rounding=ROUND_HALF_UP)
     
     def _get_buyer_fee_percentage(self, session_rules: Dict[str, Any]) -> float:
         """Get buyer fee percentage"""
@@ -4,12 +4,12 @@ Handles the settlement process after auction sessions close
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from domain.entities.payment import Payment
 from domain.entities.payout import Payout
 from domain.enums import (
     SessionStatus, PaymentStatus, PayoutStatus, 
-    JewelryStatus, BidStatus, PaymentMethod
+    JewelryStatus, PaymentMethod, UserRole
 )
 from domain.exceptions import (
     ValidationError, 
@@ -31,9 +31,22 @@ from sqlalchemy import text
 import uuid
 
 
+# Roles allowed to settle sessions
+_STAFF_ROLES = frozenset((UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN))
+
+# Money columns are DECIMAL(12, 2)
+_CENT = Decimal('0.01')
+
+
 class SettlementService:
     """Settlement service for auction sessions"""
     
+    __slots__ = (
+        'session_repository', 'session_item_repository', 'bid_repository',
+        'payment_repository', 'payout_repository', 'jewelry_repository',
+        'fee_repository'
+    )
+    
     def __init__(self, 
                  session_repository: IAuctionSessionRepository,
                  session_item_repository: ISessionItemRepository,
@@ -52,10 +65,8 @@ class SettlementService:
     
     def settle_session(self, session_id: str, user_role: str) -> Dict[str, Any]:
         """Settle an auction session after it closes"""
-        from domain.enums import UserRole
-        
         # Only staff and above can settle sessions
-        if user_role not in [UserRole.STAFF, UserRole.MANAGER, UserRole.ADMIN]:
+        if user_role not in _STAFF_ROLES:
             raise AuthorizationError("Not authorized to settle sessions")
         
         session = self.session_repository.get_by_id(session_id)
@@ -65,22 +76,33 @@ class SettlementService:
         if session.status != SessionStatus.CLOSED:
             raise BusinessRuleViolationError("Can only settle closed sessions")
         
+        db_session = get_db_session()
         try:
-            db_session = get_db_session()
-            
             # Get all session items
             session_items = self.session_item_repository.get_by_session_id(session_id)
             
+            # Resolve the default fee schedule once for every lot in the session
+            default_fee = self._resolve_default_fee(session.rules)
+            
+            # Preload existing payments/payouts for all lots (two queries, not two per lot)
+            session_item_ids = [session_item.id for session_item in session_items]
+            existing_payments = self.payment_repository.get_by_session_item_ids(session_item_ids)
+            existing_payouts = self.payout_repository.get_by_session_item_ids(session_item_ids)
+            
             settlement_results = []
             
             for session_item in session_items:
-                result = self._settle_session_item(session_item, session)
+                result = self._settle_session_item(
+                    session_item, session, default_fee,
+                    existing_payments.get(session_item.id),
+                    existing_payouts.get(session_item.id)
+                )
                 settlement_results.append(result)
             
             # Update session status to settled
             session.status = SessionStatus.SETTLED
             session.settled_at = datetime.utcnow()
-            session.updated_at = datetime.utcnow()
+            session.updated_at = session.settled_at
             
             self.session_repository.update(session)
             db_session.commit()
@@ -92,11 +114,12 @@ class SettlementService:
                 'results': settlement_results
             }
             
-        except Exception as e:
+        except Exception:
             db_session.rollback()
-            raise e
+            raise
     
-    def _settle_session_item(self, session_item, session) -> Dict[str, Any]:
+    def _settle_session_item(self, session_item, session, default_fee=None,
+                             existing_payment=None, existing_payout=None) -> Dict[str, Any]:
         """Settle individual session item"""
         result = {
             'session_item_id': session_item.id,
@@ -136,18 +159,21 @@ class SettlementService:
         # Mark winning bid
         self._mark_winning_bid(session_item.id, session_item.current_winner_id)
         
+        # Load the jewelry item once; it is needed for both the status change and the payout
+        jewelry_item = self.jewelry_repository.get_by_id(session_item.jewelry_item_id)
+        
         # Mark jewelry as sold
-        self._mark_jewelry_sold(session_item.jewelry_item_id)
+        self._mark_jewelry_sold(jewelry_item)
         
         # Create payment for buyer
-        payment = self._create_buyer_payment(session_item, session)
+        payment = self._create_buyer_payment(session_item, session, default_fee, existing_payment)
         if payment:
             result['payment_created'] = True
             result['payment_id'] = payment.id
             result['payment_amount'] = float(payment.amount)
         
         # Create payout for seller
-        payout = self._create_seller_payout(session_item, session)
+        payout = self._create_seller_payout(session_item, session, jewelry_item, default_fee, existing_payout)
         if payout:
             result['payout_created'] = True
             result['payout_id'] = payout.id
@@ -157,16 +183,11 @@ class SettlementService:
         return result
     
     def _mark_winning_bid(self, session_item_id: str, winner_id: str):
-        """Mark the winning bid"""
-        # Mark the highest bid as winning
-        winning_bid = self.bid_repository.get_highest_bid_for_item(session_item_id)
-        if winning_bid and winning_bid.bidder_id == winner_id:
-            winning_bid.status = BidStatus.WINNING
-            self.bid_repository.update(winning_bid)
+        """Mark the winning bid (highest valid bid, if it is the winner's)"""
+        self.bid_repository.mark_winning_bid(session_item_id, winner_id)
     
-    def _mark_jewelry_sold(self, jewelry_item_id: str):
+    def _mark_jewelry_sold(self, jewelry_item):
         """Mark jewelry item as sold"""
-        jewelry_item = self.jewelry_repository.get_by_id(jewelry_item_id)
         if jewelry_item:
             jewelry_item.status = JewelryStatus.SOLD
             jewelry_item.updated_at = datetime.utcnow()
@@ -180,16 +201,16 @@ class SettlementService:
             jewelry_item.updated_at = datetime.utcnow()
             self.jewelry_repository.update(jewelry_item)
     
-    def _create_buyer_payment(self, session_item, session) -> Optional[Payment]:
+    def _create_buyer_payment(self, session_item, session, default_fee=None,
+                              existing_payment=None) -> Optional[Payment]:
         """Create payment record for buyer"""
-        # Check if payment already exists
-        existing_payment = self.payment_repository.get_by_session_item_id(session_item.id)
+        # Payment already exists (preloaded by the caller)
         if existing_payment:
             return existing_payment
         
         # Calculate fees
         winning_bid = session_item.current_highest_bid
-        buyer_fee = self._calculate_buyer_fee(winning_bid, session.rules)
+        buyer_fee = self._calculate_buyer_fee(winning_bid, session.rules, default_fee)
         total_amount = winning_bid + buyer_fee
         
         # Create payment
@@ -210,21 +231,20 @@ class SettlementService:
         created_payment = self.payment_repository.create(payment)
         return created_payment
     
-    def _create_seller_payout(self, session_item, session) -> Optional[Payout]:
+    def _create_seller_payout(self, session_item, session, jewelry_item, default_fee=None,
+                              existing_payout=None) -> Optional[Payout]:
         """Create payout record for seller"""
-        # Get jewelry item to find seller
-        jewelry_item = self.jewelry_repository.get_by_id(session_item.jewelry_item_id)
+        # Jewelry item (already loaded by the caller) identifies the seller
         if not jewelry_item:
             return None
         
-        # Check if payout already exists
-        existing_payout = self.payout_repository.get_by_session_item_id(session_item.id)
+        # Payout already exists (preloaded by the caller)
         if existing_payout:
             return existing_payout
         
         # Calculate payout amount
         winning_bid = session_item.current_highest_bid
-        seller_fee = self._calculate_seller_fee(winning_bid, session.rules)
+        seller_fee = self._calculate_seller_fee(winning_bid, session.rules, default_fee)
         payout_amount = winning_bid - seller_fee
         
         # Create payout
@@ -244,21 +264,26 @@ class SettlementService:
         created_payout = self.payout_repository.create(payout)
         return created_payout
     
-    def _calculate_buyer_fee(self, amount: Decimal, session_rules: Dict[str, Any]) -> Decimal:
-        """Calculate buyer fee based on session rules or default fees"""
+    def _resolve_default_fee(self, session_rules: Dict[str, Any]):
+        """Load the active fee schedule, unless session rules override both percentages"""
+        if 'buyer_fee_percentage' in session_rules and 'seller_fee_percentage' in session_rules:
+            return None
+        return self.fee_repository.get_active_fee()
+    
+    def _calculate_buyer_fee(self, amount: Decimal, session_rules: Dict[str, Any],
+                             default_fee=None) -> Decimal:
+        """Calculate buyer fee based on session rules or the resolved default fee"""
         # Try to get from session rules first
         if 'buyer_fee_percentage' in session_rules:
             fee_percentage = Decimal(str(session_rules['buyer_fee_percentage']))
         else:
-            # Get default fee from database
-            default_fee = self.fee_repository.get_active_fee()
             fee_percentage = default_fee.buyer_percentage if default_fee else Decimal('10.0')
         
         min_fee = Decimal(str(session_rules.get('buyer_min_fee', 5.0)))
         max_fee = session_rules.get('buyer_max_fee')
         max_fee = Decimal(str(max_fee)) if max_fee else None
         
-        fee = amount * (fee_percentage / 100)
+        fee = amount * fee_percentage / 100
         
         if fee < min_fee:
             fee = min_fee
@@ -266,23 +291,22 @@ class SettlementService:
         if max_fee and fee > max_fee:
             fee = max_fee
         
-        return fee
+        return fee.quantize(_CENT, rounding=ROUND_HALF_UP)
     
-    def _calculate_seller_fee(self, amount: Decimal, session_rules: Dict[str, Any]) -> Decimal:
-        """Calculate seller fee based on session rules or default fees"""
+    def _calculate_seller_fee(self, amount: Decimal, session_rules: Dict[str, Any],
+                              default_fee=None) -> Decimal:
+        """Calculate seller fee based on session rules or the resolved default fee"""
         # Try to get from session rules first
         if 'seller_fee_percentage' in session_rules:
             fee_percentage = Decimal(str(session_rules['seller_fee_percentage']))
         else:
-            # Get default fee from database
-            default_fee = self.fee_repository.get_active_fee()
             fee_percentage = default_fee.seller_percentage if default_fee else Decimal('15.0')
         
         min_fee = Decimal(str(session_rules.get('seller_min_fee', 10.0)))
         max_fee = session_rules.get('seller_max_fee')
         max_fee = Decimal(str(max_fee)) if max_fee else None
         
-        fee = amount * (fee_percentage / 100)
+        fee = amount * fee_percentage / 100
         
         if fee < min_fee:
             fee = min_fee
@@ -290,7 +314,7 @@ class SettlementService:
         if max_fee and fee > max_fee:
             fee = max_fee
         
-        return fee
+        return fee.quantize(_CENT, rounding=ROUND_HALF_UP)
     
     def _get_buyer_fee_percentage(self, session_rules: Dict[str, Any]) -> float:
         """Get buyer fee percentage"""
@@ -307,12 +331,18 @@ class SettlementService:
             raise NotFoundError("Auction session not found")
         
         session_items = self.session_item_repository.get_by_session_id(session_id)
-        payments = self.payment_repository.get_by_session_id(session_id)
-        payouts = self.payout_repository.get_by_session_id(session_id)
-        
-        total_sales = sum(float(item.current_highest_bid or 0) for item in session_items if item.current_highest_bid)
-        items_sold = len([item for item in session_items if item.current_highest_bid and 
-                         (not item.reserve_price or item.current_highest_bid >= item.reserve_price)])
+        payment_counts = self.payment_repository.count_by_status_for_session(session_id)
+        payout_counts = self.payout_repository.count_by_status_for_session(session_id)
+        
+        # Single pass over the session items
+        total_sales = Decimal('0.00')
+        items_sold = 0
+        for item in session_items:
+            highest_bid = item.current_highest_bid
+            if highest_bid:
+                total_sales += highest_bid
+                if not item.reserve_price or highest_bid >= item.reserve_price:
+                    items_sold += 1
         
         return {
             'session_id': session_id,
@@ -322,9 +352,9 @@ class SettlementService:
             'total_items': len(session_items),
             'items_sold': items_sold,
             'items_unsold': len(session_items) - items_sold,
-            'total_sales_value': total_sales,
-            'total_payments': len(payments),
-            'total_payouts': len(payouts),
-            'pending_payments': len([p for p in payments if p.status == PaymentStatus.PENDING]),
-            'pending_payouts': len([p for p in payouts if p.status == PayoutStatus.PENDING])
+            'total_sales_value': float(total_sales),
+            'total_payments': sum(payment_counts.values()),
+            'total_payouts': sum(payout_counts.values()),
+            'pending_payments': payment_counts.get(PaymentStatus.PENDING, 0),
+            'pending_payouts': payout_counts.get(PayoutStatus.PENDING, 0)
         }
@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration: make src importable and point the app at SQLite
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Read by config at import time, so set before the app is imported
+os.environ.setdefault('APP_ENV', 'testing')
+os.environ.setdefault('DB_URL', 'sqlite:///:memory:')
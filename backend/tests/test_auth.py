@@ -4,7 +4,7 @@ Tests for authentication functionality
 import pytest
 import json
 from flask import Flask
-from src.create_app import create_app
+from app import create_app
 from infrastructure.databases.mssql import db
 from domain.enums import UserRole
 
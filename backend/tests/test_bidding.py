@@ -0,0 +1,175 @@
+"""
+Tests for bid placement
+"""
+import pytest
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+from app import create_app
+from infrastructure.databases.mssql import db
+from infrastructure.models.user_model import UserModel
+from infrastructure.models.jewelry_model import JewelryItemModel
+from infrastructure.models.auction_model import AuctionSessionModel, SessionItemModel, EnrollmentModel, BidModel
+from infrastructure.repositories.auction_repository import SessionItemRepository
+from domain.enums import SessionStatus, EnrollmentStatus, JewelryStatus
+from domain.constants import BID_CONFLICT_MAX_ATTEMPTS
+
+
+@pytest.fixture
+def app():
+    """Create test app"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """Create test client"""
+    return app.test_client()
+
+
+@pytest.fixture
+def open_lot(client):
+    """Register a bidder approved for an open session with one lot"""
+    register_data = {
+        'name': 'John Doe',
+        'email': 'john@example.com',
+        'password': 'SecurePass123!'
+    }
+    register_response = client.post('/api/v1/auth/register',
+                                   data=json.dumps(register_data),
+                                   content_type='application/json')
+    token = json.loads(register_response.data)['data']['access_token']
+    bidder = UserModel.query.filter_by(email='john@example.com').first()
+
+    jewelry_item = JewelryItemModel(
+        code='JW-TEST01',
+        title='Gold Ring',
+        description='18k gold ring',
+        owner_user_id=bidder.id,
+        status=JewelryStatus.IN_AUCTION
+    )
+    session = AuctionSessionModel(
+        code='AS-TEST01',
+        name='Test Session',
+        status=SessionStatus.OPEN,
+        start_at=datetime.utcnow() - timedelta(hours=1),
+        end_at=datetime.utcnow() + timedelta(hours=1)
+    )
+    db.session.add_all([jewelry_item, session])
+    db.session.flush()
+
+    session_item = SessionItemModel(
+        session_id=session.id,
+        jewelry_item_id=jewelry_item.id,
+        lot_number=1,
+        start_price=Decimal('100.00'),
+        step_price=Decimal('10.00')
+    )
+    enrollment = EnrollmentModel(
+        session_id=session.id,
+        user_id=bidder.id,
+        status=EnrollmentStatus.APPROVED
+    )
+    db.session.add_all([session_item, enrollment])
+    db.session.commit()
+
+    return {
+        'headers': {'Authorization': f'Bearer {token}'},
+        'bid': {
+            'session_id': session.id,
+            'session_item_id': session_item.id,
+            'amount': 150.00
+        }
+    }
+
+
+class TestPlaceBid:
+    """Test bid placement endpoint"""
+
+    def test_place_bid_success(self, client, open_lot):
+        """Test a valid bid is stored and becomes the lot's highest bid"""
+        response = client.post('/api/v1/bids',
+                             data=json.dumps(open_lot['bid']),
+                             content_type='application/json',
+                             headers=open_lot['headers'])
+
+        assert response.status_code == 201
+        response_data = json.loads(response.data)
+        assert response_data['success'] is True
+        assert response_data['data']['amount'] == 150.00
+
+        session_item = db.session.get(SessionItemModel, open_lot['bid']['session_item_id'])
+        assert session_item.current_highest_bid == Decimal('150.00')
+        assert session_item.version == 2
+
+    def test_place_bid_retries_version_conflict(self, client, open_lot):
+        """Test a version conflict is retried and the bid still lands"""
+        original_apply_bid = SessionItemRepository.apply_bid
+        attempts = []
+
+        def conflict_once(repository, *args):
+            attempts.append(args)
+            if len(attempts) == 1:
+                return False
+            return original_apply_bid(repository, *args)
+
+        with patch.object(SessionItemRepository, 'apply_bid', autospec=True, side_effect=conflict_once), \
+                patch('services.bidding_service.time.sleep'):
+            response = client.post('/api/v1/bids',
+                                 data=json.dumps(open_lot['bid']),
+                                 content_type='application/json',
+                                 headers=open_lot['headers'])
+
+        assert response.status_code == 201
+        assert len(attempts) == 2
+        assert BidModel.query.count() == 1
+
+    def test_place_bid_conflict_exhausts_retries(self, client, open_lot):
+        """Test persistent version conflicts return 409 and leave no bid behind"""
+        with patch.object(SessionItemRepository, 'apply_bid', return_value=False) as apply_bid, \
+                patch('services.bidding_service.time.sleep'):
+            response = client.post('/api/v1/bids',
+                                 data=json.dumps(open_lot['bid']),
+                                 content_type='application/json',
+                                 headers=open_lot['headers'])
+
+        assert response.status_code == 409
+        assert 'error' in json.loads(response.data)
+        assert apply_bid.call_count == BID_CONFLICT_MAX_ATTEMPTS
+        assert BidModel.query.count() == 0
+
+    def test_place_bid_idempotent_retry(self, client, open_lot):
+        """Test a repeated Idempotency-Key returns the original bid without a second insert"""
+        headers = dict(open_lot['headers'], **{'Idempotency-Key': 'bid-key-1'})
+        first = client.post('/api/v1/bids',
+                          data=json.dumps(open_lot['bid']),
+                          content_type='application/json',
+                          headers=headers)
+        second = client.post('/api/v1/bids',
+                           data=json.dumps(open_lot['bid']),
+                           content_type='application/json',
+                           headers=headers)
+
+        assert first.status_code == 201
+        assert second.status_code == 201
+        assert json.loads(second.data)['data']['id'] == json.loads(first.data)['data']['id']
+        assert BidModel.query.count() == 1
+
+    def test_place_bid_out_of_range_amount(self, client, open_lot):
+        """Test an amount too large for DECIMAL(12,2) is rejected with 400"""
+        bid = dict(open_lot['bid'], amount=1e30)
+        response = client.post('/api/v1/bids',
+                             data=json.dumps(bid),
+                             content_type='application/json',
+                             headers=open_lot['headers'])
+
+        assert response.status_code == 400
+        assert BidModel.query.count() == 0
@@ -0,0 +1,13 @@
+"""
+Tests for SQLAlchemy model mappings
+"""
+from sqlalchemy.orm import configure_mappers
+import infrastructure.models  # noqa: F401  (registers every model on db.Model)
+
+
+class TestModelMappings:
+    """Smoke tests for ORM mapper configuration"""
+    
+    def test_mappers_configure(self):
+        """All relationships resolve (no ambiguous or missing foreign keys)"""
+        configure_mappers()